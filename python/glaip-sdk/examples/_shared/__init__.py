@@ -39,12 +39,17 @@ from .printing import (
 from .runtime import (
     RUN_ID,
     PerformanceTimer,
+    Step,
+    get_client,
     get_run_info,
     measure_time,
+    parallel_create,
     print_run_info,
     register_cleanup,
+    register_delete,
     resource_tracker,
     retry_handler,
+    run_dag,
     timeout_handler,
 )
 
@@ -75,7 +80,12 @@ __all__ = [
     "clear_line",
     "flush_output",
     "RUN_ID",
+    "get_client",
     "register_cleanup",
+    "register_delete",
+    "parallel_create",
+    "Step",
+    "run_dag",
     "timeout_handler",
     "retry_handler",
     "resource_tracker",
@@ -7,22 +7,46 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Any
 
+try:
+    from dotenv import load_dotenv as _load_dotenv
+except ImportError:
+    # python-dotenv not available, continue with system env
+    _load_dotenv = None
+
 # Keys that should be masked in output
-MASK_KEYS = {
-    "AIP_API_KEY",
-    "AIP_SECRET_KEY",
-    "OPENAI_API_KEY",
-    "ANTHROPIC_API_KEY",
-    "GOOGLE_API_KEY",
-    "AWS_ACCESS_KEY_ID",
-    "AWS_SECRET_ACCESS_KEY",
-    "AZURE_OPENAI_API_KEY",
-    "AZURE_OPENAI_API_VERSION",
-}
+MASK_KEYS = frozenset(
+    {
+        "AIP_API_KEY",
+        "AIP_SECRET_KEY",
+        "OPENAI_API_KEY",
+        "ANTHROPIC_API_KEY",
+        "GOOGLE_API_KEY",
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "AZURE_OPENAI_API_KEY",
+        "AZURE_OPENAI_API_VERSION",
+    }
+)
+
+# Keys reported by validate_env_config and read by EnvConfig.from_env
+_CORE_KEYS = ("AIP_API_URL", "AIP_API_KEY", "AIP_ORG_ID", "AIP_PROJECT_ID")
+_OPTIONAL_KEYS = (
+    "AIP_TIMEOUT",
+    "AIP_RETRY_MAX",
+    "AIP_TLS_VERIFY",
+    "AIP_CA_BUNDLE",
+    "AIP_CONCURRENCY",
+    "AIP_DEFAULT_MODEL",
+)
+_RELEVANT_KEYS = _CORE_KEYS + _OPTIONAL_KEYS
+
+# EnvConfig instances keyed by the environment values they were built from
+_env_config_cache: dict[tuple[tuple[str, str | None], ...], "EnvConfig"] = {}
 
 
 def mask(key: str, value: str | None) -> str:
@@ -57,6 +81,19 @@ def require(*keys: str) -> None:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Load the .env file into the process environment, at most once."""
+    if _load_dotenv is None:
+        return
+
+    try:
+        _load_dotenv()
+    except Exception:
+        # Other errors loading .env, continue with system env
+        pass
+
+
 def load_env(required: tuple[str, ...] = ("AIP_API_URL", "AIP_API_KEY")) -> None:
     """Load environment variables from .env file and validate required ones.
 
@@ -66,17 +103,7 @@ def load_env(required: tuple[str, ...] = ("AIP_API_URL", "AIP_API_KEY")) -> None
     Raises:
         RuntimeError: If required environment variables are missing
     """
-    # Try to load from .env file
-    try:
-        from dotenv import load_dotenv
-
-        load_dotenv()
-    except ImportError:
-        # python-dotenv not available, continue with system env
-        pass
-    except Exception:
-        # Other errors loading .env, continue with system env
-        pass
+    _load_env_once()
 
     # Validate required environment variables
     require(*required)
@@ -107,27 +134,22 @@ def validate_env_config() -> dict[str, Any]:
     # Load and validate environment
     load_env()
 
+    env = os.environ
+
     # Build configuration dict with masking
     config = {}
-    for key in ["AIP_API_URL", "AIP_API_KEY", "AIP_ORG_ID", "AIP_PROJECT_ID"]:
-        value = os.getenv(key)
-        if value:
-            config[key] = mask(key, value)
-        else:
+    for key in _CORE_KEYS:
+        value = env.get(key)
+        if not value:
             config[key] = None
+        elif key in MASK_KEYS:
+            config[key] = "****"
+        else:
+            config[key] = value
 
     # Add optional configuration
-    optional_keys = [
-        "AIP_TIMEOUT",
-        "AIP_RETRY_MAX",
-        "AIP_TLS_VERIFY",
-        "AIP_CA_BUNDLE",
-        "AIP_CONCURRENCY",
-        "AIP_DEFAULT_MODEL",
-    ]
-
-    for key in optional_keys:
-        value = os.getenv(key)
+    for key in _OPTIONAL_KEYS:
+        value = env.get(key)
         if value:
             config[key] = value
         else:
@@ -136,9 +158,12 @@ def validate_env_config() -> dict[str, Any]:
     return config
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EnvConfig:
-    """Environment configuration container."""
+    """Environment configuration container.
+
+    Instances are immutable, so cached configs can be shared safely.
+    """
 
     api_url: str
     api_key: str
@@ -155,6 +180,10 @@ class EnvConfig:
     def from_env(cls) -> "EnvConfig":
         """Create EnvConfig from environment variables.
 
+        Instances are cached by the values of the relevant environment
+        variables, so repeated calls with an unchanged environment return the
+        same object.
+
         Returns:
             EnvConfig instance with current environment values
 
@@ -163,15 +192,52 @@ class EnvConfig:
         """
         load_env()
 
-        return cls(
-            api_url=os.getenv("AIP_API_URL", ""),
-            api_key=os.getenv("AIP_API_KEY", ""),
-            org_id=os.getenv("AIP_ORG_ID"),
-            project_id=os.getenv("AIP_PROJECT_ID"),
-            timeout=float(os.getenv("AIP_TIMEOUT", "30.0")),
-            retry_max=int(os.getenv("AIP_RETRY_MAX", "3")),
-            tls_verify=os.getenv("AIP_TLS_VERIFY", "true").lower() == "true",
-            ca_bundle=os.getenv("AIP_CA_BUNDLE"),
-            concurrency=int(os.getenv("AIP_CONCURRENCY", "4")),
-            default_model=os.getenv("AIP_DEFAULT_MODEL"),
+        env = os.environ
+        values = {key: env.get(key) for key in _RELEVANT_KEYS}
+
+        cache_key = tuple(values.items())
+        cached = _env_config_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        def get(key: str, default: str) -> str:
+            # Defaults apply only to unset variables; an empty value is kept
+            value = values[key]
+            return default if value is None else value
+
+        config = cls(
+            api_url=get("AIP_API_URL", ""),
+            api_key=get("AIP_API_KEY", ""),
+            org_id=values["AIP_ORG_ID"],
+            project_id=values["AIP_PROJECT_ID"],
+            timeout=float(get("AIP_TIMEOUT", "30.0")),
+            retry_max=int(get("AIP_RETRY_MAX", "3")),
+            tls_verify=get("AIP_TLS_VERIFY", "true").lower() == "true",
+            ca_bundle=values["AIP_CA_BUNDLE"],
+            concurrency=int(get("AIP_CONCURRENCY", "4")),
+            default_model=values["AIP_DEFAULT_MODEL"],
         )
+        _env_config_cache[cache_key] = config
+        return config
+
+    @classmethod
+    def reload(cls) -> "EnvConfig":
+        """Re-read the .env file and rebuild EnvConfig, bypassing all caches.
+
+        Values in the .env file override ones already in the environment, so
+        edits made since the first load are picked up.
+
+        Returns:
+            Freshly built EnvConfig instance
+
+        Raises:
+            RuntimeError: If required environment variables are missing
+        """
+        if _load_dotenv is not None:
+            try:
+                _load_dotenv(override=True)
+            except Exception:
+                # Other errors loading .env, continue with system env
+                pass
+        _env_config_cache.clear()
+        return cls.from_env()
@@ -7,9 +7,32 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import functools
+import json
 import sys
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Heading rules and line padding, built once instead of on every call
+_EQ60 = "=" * 60
+_DASH40 = "-" * 40
+_DASH20 = "-" * 20
+_CLEAR_LINE = "\r" + " " * 80 + "\r"
+
+# Progress bar segments, sliced to the filled/empty lengths on each update
+_PROGRESS_BAR_LENGTH = 30
+_PROGRESS_FILLED = "█" * _PROGRESS_BAR_LENGTH
+_PROGRESS_EMPTY = "░" * _PROGRESS_BAR_LENGTH
+
+# Last drawn filled length per progress description
+_progress_state: dict[str, int] = {}
+
 
 def h1(text: str) -> None:
     """Print a main heading.
@@ -17,9 +40,7 @@ def h1(text: str) -> None:
     Args:
         text: Heading text to display
     """
-    print(f"\n{'=' * 60}")
-    print(f"🚀 {text}")
-    print(f"{'=' * 60}")
+    sys.stdout.write(f"\n{_EQ60}\n🚀 {text}\n{_EQ60}\n")
 
 
 def h2(text: str) -> None:
@@ -28,9 +49,7 @@ def h2(text: str) -> None:
     Args:
         text: Heading text to display
     """
-    print(f"\n{'-' * 40}")
-    print(f"📁 {text}")
-    print(f"{'-' * 40}")
+    sys.stdout.write(f"\n{_DASH40}\n📁 {text}\n{_DASH40}\n")
 
 
 def h3(text: str) -> None:
@@ -39,8 +58,7 @@ def h3(text: str) -> None:
     Args:
         text: Heading text to display
     """
-    print(f"\n🔧 {text}")
-    print("-" * 20)
+    sys.stdout.write(f"\n🔧 {text}\n{_DASH20}\n")
 
 
 def step(text: str) -> None:
@@ -113,7 +131,13 @@ def separator(char: str = "-", length: int = 60) -> None:
         char: Character to use for separation
         length: Length of the separator line
     """
-    print(char * length)
+    print(_rule(char, length))
+
+
+@functools.lru_cache(maxsize=16)
+def _rule(char: str, length: int) -> str:
+    """Build (and cache) a horizontal rule of the given character and length."""
+    return char * length
 
 
 def blank_line() -> None:
@@ -137,23 +161,24 @@ def print_table(
     if not headers or not rows:
         return
 
-    # Calculate column widths
-    col_widths = [len(str(h)) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
+    # Stringify every cell once and reuse it for both widths and output
+    str_headers = [str(h) for h in headers]
+    str_rows = [[str(cell) for cell in row] for row in rows]
 
-    # Print header
-    header_row = " | ".join(str(h).ljust(col_widths[i]) for i, h in enumerate(headers))
-    print(f"  {header_row}")
-    print(f"  {'-' * len(header_row)}")
+    # Calculate column widths
+    col_widths = [
+        max(len(h), max((len(row[i]) for row in str_rows if i < len(row)), default=0))
+        for i, h in enumerate(str_headers)
+    ]
 
-    # Print rows
-    for row in rows:
-        row_str = " | ".join(
-            str(cell).ljust(col_widths[i]) for i, cell in enumerate(row)
-        )
-        print(f"  {row_str}")
+    # Build the whole table and emit it with a single write
+    header_row = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(str_headers))
+    lines = [f"  {header_row}", f"  {'-' * len(header_row)}"]
+    lines.extend(
+        "  " + " | ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(row))
+        for row in str_rows
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_json(data: Any, title: str | None = None) -> None:
@@ -166,14 +191,17 @@ def print_json(data: Any, title: str | None = None) -> None:
     if title:
         h3(title)
 
-    try:
-        import json
-
-        formatted = json.dumps(data, indent=2, default=str)
+    if ORJSON_AVAILABLE:
+        formatted = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
         print(f"  {formatted}")
-    except ImportError:
-        # Fallback if json module not available
-        print(f"  {data}")
+        return
+
+    formatted = json.dumps(data, indent=2, default=str)
+    print(f"  {formatted}")
 
 
 def print_list(items: list[Any], title: str | None = None, bullet: str = "•") -> None:
@@ -216,21 +244,32 @@ def print_progress(current: int, total: int, description: str = "Progress") -> N
     if total <= 0:
         return
 
-    percentage = (current / total) * 100
-    bar_length = 30
-    filled_length = int(bar_length * current // total)
+    filled_length = min(
+        int(_PROGRESS_BAR_LENGTH * current // total), _PROGRESS_BAR_LENGTH
+    )
+    complete = current >= total
+
+    # Only redraw when the bar itself changes, plus once on completion
+    if not complete and _progress_state.get(description) == filled_length:
+        return
+    _progress_state[description] = filled_length
 
-    bar = "█" * filled_length + "░" * (bar_length - filled_length)
+    percentage = (current / total) * 100
+    bar = (
+        _PROGRESS_FILLED[:filled_length]
+        + _PROGRESS_EMPTY[: _PROGRESS_BAR_LENGTH - filled_length]
+    )
 
     print(f"\r  {description}: |{bar}| {percentage:.1f}% ({current}/{total})", end="")
 
-    if current >= total:
+    if complete:
+        del _progress_state[description]
         print()  # New line when complete
 
 
 def clear_line() -> None:
     """Clear the current line."""
-    print("\r" + " " * 80 + "\r", end="")
+    print(_CLEAR_LINE, end="")
 
 
 def flush_output() -> None:
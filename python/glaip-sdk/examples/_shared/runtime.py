@@ -8,12 +8,14 @@ Authors:
 """
 
 import atexit
+import functools
 import signal
 import time
 import uuid
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, NamedTuple
 
 # Global run ID for this execution
 RUN_ID = str(uuid.uuid4())[:8]
@@ -22,17 +24,71 @@ RUN_ID = str(uuid.uuid4())[:8]
 _cleanup_functions: list[Callable[[], None]] = []
 _cleanup_registry: dict[str, Any] = {}
 
+# Resource deletions queued by register_delete: id(client) -> (client, kind -> ids),
+# with ids kept as dict keys so each resource is queued once
+_pending_deletes: dict[int, tuple[Any, dict[str, dict[str, None]]]] = {}
+
 
 def register_cleanup(func: Callable[[], None], name: str | None = None) -> None:
     """Register a cleanup function to be called on exit.
 
     Args:
         func: Cleanup function to register
-        name: Optional name for the cleanup function
+        name: Optional name for the cleanup function; later registrations
+            under the same name are ignored
     """
-    _cleanup_functions.append(func)
     if name:
+        # A name registered twice (e.g. by composed examples) runs once
+        if name in _cleanup_registry:
+            return
         _cleanup_registry[name] = func
+    _cleanup_functions.append(func)
+
+
+def register_delete(client: Any, kind: str, resource_id: str) -> None:
+    """Queue a resource for deletion on exit.
+
+    Queued deletions are flushed per client by run_cleanup: agents first,
+    then the tools and MCPs they may reference. A resource queued more than
+    once is deleted once, and resources already gone are skipped.
+
+    Args:
+        client: AIP client that owns the resource
+        kind: Resource kind ("agent", "tool" or "mcp")
+        resource_id: ID of the resource to delete
+    """
+    _, buckets = _pending_deletes.setdefault(id(client), (client, {}))
+    buckets.setdefault(kind, {})[resource_id] = None
+
+
+def _flush_pending_deletes() -> None:
+    """Delete all queued resources, agents first, one call at a time.
+
+    This runs from the atexit hook, where the interpreter no longer accepts
+    thread pool work, so the deletions are issued sequentially.
+    """
+    from glaip_sdk.exceptions import NotFoundError
+
+    for client, buckets in _pending_deletes.values():
+        kinds = ["agent", *(kind for kind in buckets if kind != "agent")]
+        deleted = failed = 0
+        for kind in kinds:
+            delete = getattr(client, f"delete_{kind}")
+            for resource_id in buckets.get(kind, ()):
+                try:
+                    delete(resource_id)
+                except NotFoundError:
+                    pass
+                except Exception as e:
+                    failed += 1
+                    print(f"  ❌ Deleting {kind} {resource_id} failed: {e}")
+                    continue
+                deleted += 1
+        if deleted:
+            print(f"  ✅ Deleted {deleted} queued resources")
+        if failed:
+            print(f"  ❌ {failed} queued resources could not be deleted")
+    _pending_deletes.clear()
 
 
 def unregister_cleanup(func: Callable[[], None]) -> None:
@@ -54,25 +110,213 @@ def get_cleanup_count() -> int:
     return len(_cleanup_functions)
 
 
-def run_cleanup() -> None:
-    """Run all registered cleanup functions."""
-    if not _cleanup_functions:
-        return
+def run_cleanup(concurrent: bool = False) -> None:
+    """Run all registered cleanup functions and queued deletions.
 
-    print(f"\n🧹 Running cleanup for {len(_cleanup_functions)} registered functions...")
+    Args:
+        concurrent: Run the cleanup functions in a thread pool. Only safe
+            before interpreter shutdown, so the atexit hook leaves it off.
+    """
+    if _pending_deletes:
+        print("\n🧹 Deleting queued resources...")
+        _flush_pending_deletes()
+
+    if _cleanup_functions:
+        _run_cleanup_functions(concurrent)
+
+    _close_shared_client()
 
-    for i, cleanup_func in enumerate(_cleanup_functions, 1):
-        try:
-            cleanup_func()
-            print(f"  ✅ Cleanup {i}/{len(_cleanup_functions)} completed")
-        except Exception as e:
-            print(f"  ❌ Cleanup {i}/{len(_cleanup_functions)} failed: {e}")
+
+def _run_cleanup_functions(concurrent: bool) -> None:
+    """Call the registered cleanup functions and report outcomes.
+
+    Cleanup functions must not depend on each other; deletions that must
+    happen in order (agents before their tools) go through register_delete.
+    Outcomes are printed in registration order once all functions finished.
+
+    Args:
+        concurrent: Call the functions in a thread pool instead of in turn
+    """
+    total = len(_cleanup_functions)
+    print(f"\n🧹 Running cleanup for {total} registered functions...")
+
+    errors: list[BaseException | None] = []
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=min(8, total)) as executor:
+            futures = [executor.submit(func) for func in _cleanup_functions]
+        errors = [future.exception() for future in futures]
+    else:
+        for func in _cleanup_functions:
+            try:
+                func()
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+
+    for i, error in enumerate(errors, 1):
+        if error is None:
+            print(f"  ✅ Cleanup {i}/{total} completed")
+        else:
+            print(f"  ❌ Cleanup {i}/{total} failed: {error}")
 
     # Clear the registry
     _cleanup_functions.clear()
     _cleanup_registry.clear()
 
 
+@functools.lru_cache(maxsize=1)
+def get_client() -> Any:
+    """Return the AIP client shared by every example in this process.
+
+    The client is created on first use, so environment loading,
+    authentication and the HTTP connection pool are set up once, and its
+    first connection is warmed up in the background while the example
+    carries on. It is closed by run_cleanup after queued deletions have
+    been flushed.
+
+    Returns:
+        Shared glaip_sdk Client
+    """
+    from glaip_sdk import Client
+
+    client = Client()
+    client.warmup()
+    return client
+
+
+def _close_shared_client() -> None:
+    """Close the shared client, if one was created, and forget it."""
+    if get_client.cache_info().currsize:
+        get_client().close()
+        get_client.cache_clear()
+
+
+def parallel_create(
+    client: Any,
+    specs: list[dict[str, Any]],
+    max_workers: int = 4,
+    on_created: Callable[[str, Any], None] | None = None,
+) -> list[Any]:
+    """Create independent resources concurrently.
+
+    Args:
+        client: AIP client used for the create calls
+        specs: One dict per resource; its "kind" ("agent", "tool" or "mcp")
+            selects ``client.create_<kind>`` and the remaining keys are passed
+            as keyword arguments
+        max_workers: Maximum number of create calls in flight at once
+        on_created: Called with the kind and resource for every resource
+            that was created, e.g. to register its deletion. It runs before
+            any create error is raised, so siblings of a failed create are
+            not lost.
+
+    Returns:
+        Created resources, in the same order as ``specs``
+
+    Raises:
+        Exception: The first create error, after all creates finished
+    """
+    if not specs:
+        return []
+
+    calls = []
+    for spec in specs:
+        kwargs = dict(spec)
+        kind = kwargs.pop("kind")
+        calls.append((kind, getattr(client, f"create_{kind}"), kwargs))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = [
+            (kind, executor.submit(create, **kwargs)) for kind, create, kwargs in calls
+        ]
+
+    results = []
+    error: BaseException | None = None
+    for kind, future in futures:
+        if future.exception() is not None:
+            error = error or future.exception()
+            continue
+        results.append(future.result())
+        if on_created is not None:
+            on_created(kind, results[-1])
+    if error is not None:
+        raise error
+    return results
+
+
+class Step(NamedTuple):
+    """A unit of work for run_dag."""
+
+    name: str
+    fn: Callable[[], Any]
+    deps: tuple[str, ...] = ()
+
+
+def run_dag(steps: list[Step], max_workers: int = 4) -> dict[str, Any]:
+    """Run steps concurrently, each as soon as all of its dependencies finish.
+
+    Independent steps overlap, so the run takes about as long as its critical
+    path rather than the sum of all steps. With ``max_workers=1`` the steps run
+    one at a time in dependency order, following the order given where free.
+    After a step fails no new steps are started, and the first error is
+    raised once the running ones finish.
+
+    Args:
+        steps: Steps to run; ``deps`` name other steps in the list
+        max_workers: Maximum number of steps running at once
+
+    Returns:
+        Each step's return value, keyed by step name
+
+    Raises:
+        ValueError: If a dependency is unknown or the steps form a cycle
+    """
+    by_name = {s.name: s for s in steps}
+    pending = {s.name: set(s.deps) for s in steps}
+    for name, deps in pending.items():
+        unknown = deps - by_name.keys()
+        if unknown:
+            raise ValueError(f"Step {name!r} depends on unknown steps: {unknown}")
+
+    # Reject cycles before any step runs
+    resolved: set[str] = set()
+    while len(resolved) < len(pending):
+        ready = {n for n, d in pending.items() if n not in resolved and d <= resolved}
+        if not ready:
+            raise ValueError(
+                f"Dependency cycle among steps: {pending.keys() - resolved}"
+            )
+        resolved |= ready
+
+    results: dict[str, Any] = {}
+    error: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running: dict[Any, str] = {}
+
+        def submit_ready() -> None:
+            for name in [n for n, d in pending.items() if not d]:
+                del pending[name]
+                running[executor.submit(by_name[name].fn)] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                results[name] = future.result()
+                for deps in pending.values():
+                    deps.discard(name)
+            if error is None:
+                submit_ready()
+
+    if error is not None:
+        raise error
+    return results
+
+
 @contextmanager
 def timeout_handler(seconds: float, timeout_message: str = "Operation timed out"):
     """Context manager for handling timeouts.
@@ -184,7 +428,7 @@ atexit.register(run_cleanup)
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
     print(f"\n🛑 Received signal {signum}, running cleanup...")
-    run_cleanup()
+    run_cleanup(concurrent=True)
     exit(0)
 
 
@@ -29,49 +29,33 @@ Authors:
 """
 
 import json
+import re
 import sys
 from typing import Any
 
+import yaml
+
 from glaip_sdk import Client
 
+# YAML front matter block delimited by "---" lines
+_FRONT_MATTER_PATTERN = re.compile(r"^---[ \t]*\n(.*?)\n---[ \t]*$", re.M | re.S)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def extract_metadata(docstring: str) -> dict[str, Any]:
     """Extract YAML metadata from docstring."""
+    match = _FRONT_MATTER_PATTERN.search(docstring or "")
+    if not match:
+        return {}
+
     try:
-        # Simple YAML-like parsing for demonstration
-        lines = docstring.split("\n")
-        metadata = {}
-        in_metadata = False
-
-        for line in lines:
-            line = line.strip()
-            if line == "---":
-                in_metadata = not in_metadata
-                continue
-            if in_metadata and ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Parse different value types
-                if value.startswith("[") and value.endswith("]"):
-                    # List
-                    value = [item.strip() for item in value[1:-1].split(",")]
-                elif value.isdigit():
-                    # Integer
-                    value = int(value)
-                elif value == "true":
-                    value = True
-                elif value == "false":
-                    value = False
-
-                metadata[key] = value
-
-        return metadata
-    except Exception as e:
+        metadata = yaml.load(match.group(1), Loader=_YAML_LOADER)
+    except yaml.YAMLError as e:
         print(f"Warning: Could not parse metadata: {e}")
         return {}
 
+    return metadata if isinstance(metadata, dict) else {}
+
 
 def main():
     """Main function demonstrating metadata patterns."""
@@ -4,7 +4,7 @@
 Goal: Demonstrate a complete end-to-end workflow using the AI Agent Platform
 Estimated time: 10-15 minutes
 Prerequisites: Backend services running, valid API credentials
-Run: poetry run python examples/demos/sdk/01_hello_aip_end_to_end.py
+Run: poetry run python examples/demos/sdk/01_hello_aip_end_to_end.py [--sequential]
 Cleanup: Automatic cleanup of all created resources
 
 Authors:
@@ -12,6 +12,7 @@ Authors:
 """
 
 import sys
+import textwrap
 from pathlib import Path
 
 # Add the parent directory to sys.path to import shared utilities
@@ -25,14 +26,26 @@ from examples._shared import (
     load_env,
     ok,
     print_run_info,
-    register_cleanup,
+    register_delete,
     step,
 )
 from glaip_sdk import Client
 
+_GREETING_TOOL_CODE = textwrap.dedent(
+    '''
+    def greet_user(name: str, time_of_day: str = "day") -> str:
+        """Greet a user with a personalized message."""
+        return f"Good {time_of_day}, {name}! Welcome to the AI Agent Platform."
+    '''
+)
+
 
-def main() -> bool:
-    """Main function demonstrating complete AIP workflow."""
+def main(sequential: bool = False) -> bool:
+    """Main function demonstrating complete AIP workflow.
+
+    Args:
+        sequential: Run the independent agent queries one after another
+    """
     try:
         h1("AI Agent Platform - End-to-End Demo")
         print_run_info()
@@ -47,27 +60,22 @@ def main() -> bool:
         h2("Client Initialization")
         step("Creating AIP client...")
         client = Client()
+        # Connect in the background so the first create call reuses the connection
+        client.warmup()
         ok("Client created successfully")
 
         # Step 3: Tool Creation
         h2("Tool Creation")
         step("Creating a simple greeting tool...")
 
-        tool_code = '''
-def greet_user(name: str, time_of_day: str = "day") -> str:
-    """Greet a user with a personalized message."""
-    return f"Good {time_of_day}, {name}! Welcome to the AI Agent Platform."
-'''
-
         tool = client.create_tool(
             name="greeting_tool",
             description="Simple greeting tool for demo purposes",
-            code=tool_code,
+            code=_GREETING_TOOL_CODE,
         )
         ok(f"Tool created: {tool.name} (ID: {tool.id})")
 
-        # Register cleanup for tool
-        register_cleanup(lambda: client.delete_tool(tool.id), f"delete_tool_{tool.id}")
+        register_delete(client, "tool", tool.id)
 
         # Step 4: Agent Creation
         h2("Agent Creation")
@@ -84,24 +92,39 @@ def greet_user(name: str, time_of_day: str = "day") -> str:
         )
         ok(f"Agent created: {agent.name} (ID: {agent.id})")
 
-        # Register cleanup for agent
-        register_cleanup(
-            lambda: client.delete_agent(agent.id), f"delete_agent_{agent.id}"
-        )
+        register_delete(client, "agent", agent.id)
+
+        # Steps 5 and 6 do not depend on each other, so by default they run
+        # concurrently; pass --sequential to watch each run stream in turn.
+        intro_prompt = "Hello! Can you introduce yourself and greet me?"
+        tool_prompt = "Please greet Raymond using your greeting tool"
+
+        if sequential:
+            # Step 5: Agent Execution
+            h2("Agent Execution")
+            step("Running the agent with a simple query...")
 
-        # Step 5: Agent Execution
-        h2("Agent Execution")
-        step("Running the agent with a simple query...")
+            agent.run(intro_prompt)
+            ok("Agent executed successfully")
 
-        agent.run("Hello! Can you introduce yourself and greet me?")
-        ok("Agent executed successfully")
+            # Step 6: Tool Integration Test
+            h2("Tool Integration Test")
+            step("Testing agent with tool usage...")
 
-        # Step 6: Tool Integration Test
-        h2("Tool Integration Test")
-        step("Testing agent with tool usage...")
+            agent.run(tool_prompt)
+            ok("Tool integration test completed")
+        else:
+            # Steps 5 & 6: Agent Execution and Tool Integration Test
+            h2("Agent Execution & Tool Integration Test")
+            step("Running a simple query and a tool query concurrently...")
 
-        agent.run("Please greet Raymond using your greeting tool")
-        ok("Tool integration test completed")
+            intro_response, tool_response = client.run_batch(
+                agent.id, [intro_prompt, tool_prompt], agent_name=agent.name
+            )
+            info(f"Simple query response: {intro_response[:100]}...")
+            info(f"Tool query response: {tool_response[:100]}...")
+            ok("Agent executed successfully")
+            ok("Tool integration test completed")
 
         # Step 7: Agent Update
         h2("Agent Update")
@@ -147,5 +170,5 @@ def greet_user(name: str, time_of_day: str = "day") -> str:
 
 
 if __name__ == "__main__":
-    success = main()
+    success = main(sequential="--sequential" in sys.argv[1:])
     sys.exit(0 if success else 1)
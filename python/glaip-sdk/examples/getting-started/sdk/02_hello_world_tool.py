@@ -7,33 +7,32 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
-from _utils import cleanup_temp_file, create_hello_tool_script, generate_unique_name
+from _utils import create_hello_tool_script, generate_unique_name
 
 from glaip_sdk import Client
 
 client = Client()
-temp_script_path = create_hello_tool_script()
-
-try:
-    tool = client.create_tool(
-        name=generate_unique_name("hello-world-tool"),
-        file_path=str(temp_script_path),
-        framework="langchain",
-        tool_type="custom",
-        description="A simple tool that says hello to users",
-    )
-
-    agent = client.create_agent(
-        name="hello-agent",
-        instruction="You are a friendly AI assistant. Use the hello world tool to greet users.",
-        tools=[tool],
-    )
-
-    agent.run("Please greet me using your hello world tool!")
-    agent.run("Use your tool to say hello to Alice!")
-
-    agent.delete()
-    tool.delete()
-
-finally:
-    cleanup_temp_file(temp_script_path)
+tool_code = create_hello_tool_script()
+
+tool = client.create_tool(
+    name=generate_unique_name("hello-world-tool"),
+    code=tool_code,
+    framework="langchain",
+    tool_type="custom",
+    description="A simple tool that says hello to users",
+)
+
+agent = client.create_agent(
+    name="hello-agent",
+    instruction="You are a friendly AI assistant. Use the hello world tool to greet users.",
+    tools=[tool],
+)
+
+prompts = [
+    "Please greet me using your hello world tool!",
+    "Use your tool to say hello to Alice!",
+]
+for answer in client.run_batch(agent.id, prompts):
+    print(answer)
+
+client.teardown(agent, tool)
@@ -8,7 +8,6 @@ Authors:
 """
 
 from _utils import (
-    cleanup_temp_file,
     create_calculator_tool_script,
     generate_unique_name,
 )
@@ -16,30 +15,25 @@ from _utils import (
 from glaip_sdk import Client
 
 client = Client()
-temp_script_path = create_calculator_tool_script()
-
-try:
-    tool = client.create_tool(
-        name=generate_unique_name("calculator-tool"),
-        file_path=str(temp_script_path),
-        framework="langchain",
-        tool_type="custom",
-        description="A simple calculator for basic math operations",
-    )
-
-    agent = client.create_agent(
-        name="calculator-agent",
-        instruction="You are a helpful AI assistant with access to a calculator tool. Use the calculator for math problems.",
-        tools=[tool],
-        timeout=300,
-    )
-
-    agent.run("What is 15 + 27?")
-    agent.run("Calculate 8 × 6")
-    agent.run("What is 100 ÷ 4?")
-
-    agent.delete()
-    tool.delete()
-
-finally:
-    cleanup_temp_file(temp_script_path)
+tool_code = create_calculator_tool_script()
+
+tool = client.create_tool(
+    name=generate_unique_name("calculator-tool"),
+    code=tool_code,
+    framework="langchain",
+    tool_type="custom",
+    description="A simple calculator for basic math operations",
+)
+
+agent = client.create_agent(
+    name="calculator-agent",
+    instruction="You are a helpful AI assistant with access to a calculator tool. Use the calculator for math problems.",
+    tools=[tool],
+    timeout=300,
+)
+
+questions = ["What is 15 + 27?", "Calculate 8 × 6", "What is 100 ÷ 4?"]
+for answer in client.run_batch(agent.id, questions):
+    print(answer)
+
+client.teardown(agent, tool)
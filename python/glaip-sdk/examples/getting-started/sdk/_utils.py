@@ -1,14 +1,10 @@
 """Utility functions for getting-started examples."""
 
-import tempfile
-import uuid
-from pathlib import Path
+import secrets
+from types import MappingProxyType
 from typing import Any
 
-
-def create_hello_tool_script() -> Path:
-    """Create a simple hello world tool script."""
-    script_content = '''#!/usr/bin/env python3
+HELLO_TOOL_SCRIPT = '''#!/usr/bin/env python3
 """Hello World Tool - A simple example tool for the AIP SDK."""
 
 def hello_world(name: str = "World") -> str:
@@ -24,15 +20,7 @@ def get_tool_info() -> dict:
     }
 '''
 
-    temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False)
-    temp_file.write(script_content)
-    temp_file.close()
-    return Path(temp_file.name)
-
-
-def create_calculator_tool_script() -> Path:
-    """Create a simple calculator tool script."""
-    script_content = '''#!/usr/bin/env python3
+CALCULATOR_TOOL_SCRIPT = '''#!/usr/bin/env python3
 """Calculator Tool - A simple example tool for the AIP SDK."""
 
 def calculator(operation: str, a: float, b: float) -> str:
@@ -46,32 +34,30 @@ def calculator(operation: str, a: float, b: float) -> str:
     return f"Error: Unknown operation '{operation}'"
 '''
 
-    temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False)
-    temp_file.write(script_content)
-    temp_file.close()
-    return Path(temp_file.name)
 
+def create_hello_tool_script() -> str:
+    """Return the source of a simple hello world tool."""
+    return HELLO_TOOL_SCRIPT
 
-def generate_unique_name(prefix: str) -> str:
-    """Generate a unique name with prefix."""
-    return f"{prefix}-{uuid.uuid4().hex[:8]}"
 
+def create_calculator_tool_script() -> str:
+    """Return the source of a simple calculator tool."""
+    return CALCULATOR_TOOL_SCRIPT
 
-def cleanup_temp_file(file_path: Path) -> None:
-    """Clean up temporary file."""
-    if file_path and file_path.exists():
-        file_path.unlink()
+
+def generate_unique_name(prefix: str) -> str:
+    """Generate a unique name with prefix."""
+    return f"{prefix}-{secrets.token_hex(4)}"
 
 
 class SimpleMCPServer:
     """A simple MCP server implementation for demonstration."""
 
-    def __init__(self, name: str, description: str):
-        self.name = name
-        self.description = description
-        self.is_running = False
-        self.connected_clients = 0
-        self.tools = {
+    __slots__ = ("name", "description", "is_running", "connected_clients")
+
+    # Tools are identical for every server, so they are shared read-only
+    tools = MappingProxyType(
+        {
             "hello": {
                 "name": "hello",
                 "description": "Say hello to someone",
@@ -85,6 +71,14 @@ class SimpleMCPServer:
                 "returns": "string",
             },
         }
+    )
+    TOOL_NAMES = tuple(tools)
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.is_running = False
+        self.connected_clients = 0
 
     def start(self) -> bool:
         """Start the MCP server."""
@@ -106,7 +100,7 @@ class SimpleMCPServer:
             "protocol": "mcp",
             "version": "1.0.0",
             "capabilities": {
-                "tools": list(self.tools.keys()),
+                "tools": self.TOOL_NAMES,
                 "resources": ["time", "hello"],
                 "prompts": [],
             },
@@ -139,7 +133,7 @@ class SimpleMCPServer:
             "name": self.name,
             "running": self.is_running,
             "connected_clients": self.connected_clients,
-            "available_tools": list(self.tools.keys()),
+            "available_tools": self.TOOL_NAMES,
             "uptime": "demonstration mode",
         }
 
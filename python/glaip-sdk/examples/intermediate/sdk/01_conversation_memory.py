@@ -11,12 +11,67 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import functools
 import sys
 import uuid
+from collections import deque
+from itertools import islice
 from typing import Any
 
 from glaip_sdk import Client
 
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Most recent chat messages resent with each run; older context is left to the
+# server-side session memory keyed by session_id.
+HISTORY_WINDOW = 10
+
+# Chat message keys and roles, shared by every message in every history
+ROLE = sys.intern("role")
+CONTENT = sys.intern("content")
+USER = sys.intern("user")
+ASSISTANT = sys.intern("assistant")
+
+
+class ChatHistory:
+    """Conversation history kept as parallel role and content deques.
+
+    Messages are only turned into ``{"role", "content"}`` dicts when a window of
+    them is sent with a run, instead of storing a dict per message. With
+    ``max_messages`` set, the oldest messages are dropped automatically.
+    """
+
+    __slots__ = ("roles", "contents")
+
+    def __init__(self, max_messages: int | None = None):
+        self.roles: deque[str] = deque(maxlen=max_messages)
+        self.contents: deque[str] = deque(maxlen=max_messages)
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def add_turn(self, user_message: str, assistant_response: str) -> None:
+        """Record a user message and the assistant's response."""
+        self.roles.extend((USER, ASSISTANT))
+        self.contents.extend((user_message, assistant_response))
+
+    def recent(self, limit: int | None = None) -> list[dict[str, str]]:
+        """Return the last ``limit`` messages (all if None) as chat dicts."""
+        start = 0 if limit is None else max(len(self.roles) - limit, 0)
+        return [
+            {ROLE: role, CONTENT: content}
+            for role, content in zip(
+                islice(self.roles, start, None),
+                islice(self.contents, start, None),
+                strict=True,
+            )
+        ]
+
 
 def create_memory_agent(client: Client, name: str, instruction: str) -> Any:
     """Create an agent with memory capabilities."""
@@ -33,21 +88,54 @@ def run_conversation_with_memory(
     """Run a conversation and build chat history."""
     print(f"\n🔄 Running conversation with session: {session_id}")
 
-    chat_history = []
+    chat_history = ChatHistory()
 
     for i, message in enumerate(messages, 1):
         print(f"\n💬 Message {i}: {message}")
 
-        # Run agent with current chat history
-        response = agent.run(message, session_id=session_id, chat_history=chat_history)
+        # Run agent with the recent chat history window
+        response = agent.run(
+            message,
+            session_id=session_id,
+            chat_history=chat_history.recent(HISTORY_WINDOW),
+        )
 
         # Add user message and agent response to chat history
-        chat_history.append({"role": "user", "content": message})
-        chat_history.append({"role": "assistant", "content": response})
+        chat_history.add_turn(message, response)
 
         print(f"🤖 Response {i}: {response[:100]}...")
 
-    return chat_history
+    return chat_history.recent()
+
+
+@functools.lru_cache(maxsize=32)
+def _fact_matcher(facts: tuple[str, ...]):
+    """Build a multi-pattern matcher over the lowercased facts."""
+    automaton = ahocorasick.Automaton()
+    for fact, fact_lower in _lowered(facts):
+        automaton.add_word(fact_lower, fact)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=32)
+def _lowered(facts: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Pair each fact with its lowercase form, once per fact list."""
+    return tuple((fact, fact.lower()) for fact in facts)
+
+
+def find_missed_facts(response: str, expected_facts: list[str]) -> list[str]:
+    """Return the expected facts not mentioned in the response (case-insensitive)."""
+    response_lower = response.lower()
+    if AHOCORASICK_AVAILABLE and expected_facts:
+        automaton = _fact_matcher(tuple(expected_facts))
+        found = {fact for _, fact in automaton.iter(response_lower)}
+        return [fact for fact in expected_facts if fact not in found]
+    return [
+        fact
+        for fact, fact_lower in _lowered(tuple(expected_facts))
+        if fact_lower not in response_lower
+    ]
 
 
 def validate_memory_recall(
@@ -66,10 +154,7 @@ def validate_memory_recall(
     print(f"Response: {response}")
 
     # Check if expected facts are mentioned
-    missed_facts = []
-    for fact in expected_facts:
-        if fact.lower() not in response.lower():
-            missed_facts.append(fact)
+    missed_facts = find_missed_facts(response, expected_facts)
 
     if missed_facts:
         for fact in missed_facts:
@@ -96,47 +181,49 @@ def demonstrate_memory_truncation(agent, session_id: str):
         for i in range(1, 21)
     ]
 
-    chat_history = []
+    # Bounded history: older messages fall out as new turns are added
+    chat_history = ChatHistory(max_messages=HISTORY_WINDOW)
 
     for i, message in enumerate(long_messages, 1):
         print(f"\n💬 Message {i}: {message}")
 
-        # Run agent with current chat history
-        response = agent.run(message, session_id=session_id, chat_history=chat_history)
+        # Run agent with the recent chat history window
+        response = agent.run(
+            message,
+            session_id=session_id,
+            chat_history=chat_history.recent(),
+        )
 
         # Add to chat history
-        chat_history.append({"role": "user", "content": message})
-        chat_history.append({"role": "assistant", "content": response})
+        chat_history.add_turn(message, response)
 
         print(f"🤖 Response {i}: {response[:100]}...")
 
     # Test memory recall for early and recent messages
     print("\n🔍 Testing memory recall after long conversation...")
 
-    # Test early message recall
+    # Both questions share the session's server-side memory, so they run one
+    # after the other; concurrent runs would update it in a racy order.
+    recent_history = chat_history.recent()
     early_response = agent.run(
         "What was the first message about?",
         session_id=session_id,
-        chat_history=chat_history[
-            -10:
-        ],  # Only keep last 10 messages for memory management
+        chat_history=recent_history,
     )
-    print(f"🔍 Early message recall: {early_response[:100]}...")
-
-    # Test recent message recall
     recent_response = agent.run(
         "What was the last message about?",
         session_id=session_id,
-        chat_history=chat_history[
-            -10:
-        ],  # Only keep last 10 messages for memory management
+        chat_history=recent_history,
     )
+    print(f"🔍 Early message recall: {early_response[:100]}...")
     print(f"🔍 Recent message recall: {recent_response[:100]}...")
+    early_lower = early_response.lower()
+    recent_lower = recent_response.lower()
 
     # Check if memory truncation is working
-    if "message number 1" not in early_response.lower():
+    if "message number 1" not in early_lower:
         print("⚠️  Early memory may have been truncated")
-    if "message number 20" in recent_response.lower():
+    if "message number 20" in recent_lower:
         print("✅ Recent memory retention working")
     else:
         print("❌ Recent memory not working as expected")
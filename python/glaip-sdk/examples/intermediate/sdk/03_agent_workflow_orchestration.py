@@ -11,24 +11,47 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import inspect
 import sys
 from pathlib import Path
 
-# Add the parent directory to sys.path to import shared utilities
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add the project root to sys.path to import shared utilities
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 from examples._shared import (
     fail,
+    get_client,
     h1,
     h2,
     info,
     load_env,
     ok,
     print_run_info,
-    register_cleanup,
+    register_delete,
     step,
 )
-from glaip_sdk import Client
+
+
+def add_numbers(a: float, b: float) -> float:
+    """Add two numbers together."""
+    return a + b
+
+
+def multiply_numbers(a: float, b: float) -> float:
+    """Multiply two numbers together."""
+    return a * b
+
+
+def calculate_area(length: float, width: float) -> float:
+    """Calculate the area of a rectangle."""
+    return length * width
+
+
+CALC_FUNCTIONS = (add_numbers, multiply_numbers, calculate_area)
+
+# Tool source uploaded to the backend, built once from the functions above,
+# which also run in-process to check the agents' answers
+_CALC_TOOL_CODE = "\n\n".join(inspect.getsource(f) for f in CALC_FUNCTIONS)
 
 
 def main() -> bool:
@@ -46,38 +69,22 @@ def main() -> bool:
         # Step 2: Client Initialization
         h2("Client Initialization")
         step("Creating AIP client...")
-        client = Client()
+        client = get_client()
         ok("Client created successfully")
 
         # Step 3: Create Simple Tools
         h2("Tool Creation")
         step("Creating a simple calculation tool...")
 
-        calc_tool_code = '''
-def add_numbers(a: float, b: float) -> float:
-    """Add two numbers together."""
-    return a + b
-
-def multiply_numbers(a: float, b: float) -> float:
-    """Multiply two numbers together."""
-    return a * b
-
-def calculate_area(length: float, width: float) -> float:
-    """Calculate the area of a rectangle."""
-    return length * width
-'''
-
         calc_tool = client.create_tool(
             name="calculation_tool",
             description="Simple mathematical operations for workflow demonstration",
-            code=calc_tool_code,
+            code=_CALC_TOOL_CODE,
         )
         ok(f"Calculation tool created: {calc_tool.name} (ID: {calc_tool.id})")
 
-        # Register cleanup for tool
-        register_cleanup(
-            lambda: client.delete_tool(calc_tool.id), f"delete_calc_tool_{calc_tool.id}"
-        )
+        # Queue deletion on exit for tool
+        register_delete(client, "tool", calc_tool.id)
 
         # Step 4: Create Specialized Agents
         h2("Agent Creation")
@@ -94,11 +101,8 @@ def calculate_area(length: float, width: float) -> float:
         )
         ok(f"Math specialist agent created: {math_agent.name} (ID: {math_agent.id})")
 
-        # Register cleanup for math agent
-        register_cleanup(
-            lambda: client.delete_agent(math_agent.id),
-            f"delete_math_agent_{math_agent.id}",
-        )
+        # Queue deletion on exit for math agent
+        register_delete(client, "agent", math_agent.id)
 
         step("Creating a workflow coordinator agent...")
 
@@ -115,39 +119,49 @@ def calculate_area(length: float, width: float) -> float:
             f"Workflow coordinator created: {coordinator_agent.name} (ID: {coordinator_agent.id})"
         )
 
-        # Register cleanup for coordinator agent
-        register_cleanup(
-            lambda: client.delete_agent(coordinator_agent.id),
-            f"delete_coordinator_agent_{coordinator_agent.id}",
-        )
-
-        # Step 5: Test Basic Workflow
-        h2("Basic Workflow Testing")
-        step("Testing math specialist with direct calculation...")
+        # Queue deletion on exit for coordinator agent
+        register_delete(client, "agent", coordinator_agent.id)
 
-        math_agent.run("Please calculate 15 + 27 and show your work")
-        ok("Math specialist executed successfully")
+        # Steps 5-7: Workflow Testing
+        # The three runs use different prompts and do not depend on each other.
+        # The direct math run and the multi-step workflow are started in the
+        # background, the coordinated run streams in the foreground, and the
+        # background results are collected once it finishes.
+        h2("Workflow Testing")
+        step("Starting direct and multi-step workflows in the background...")
 
-        # Step 6: Test Agent Coordination
-        h2("Agent Coordination Testing")
-        step("Testing workflow coordinator with delegation...")
+        math_task = math_agent.run(
+            "Please calculate 15 + 27 and show your work", background=True
+        )
+        complex_task = coordinator_agent.run(
+            "I need to solve this problem: A rectangular garden has a length of 12 meters "
+            "and a width of 8 meters. I want to add a path around it that's 1 meter wide. "
+            "What's the new total area? Please work through this step by step.",
+            background=True,
+        )
 
-        coordinator_agent.run(
+        step("Running coordinated workflow...")
+        coordination_response = coordinator_agent.run(
             "I need to calculate the area of a rectangle that is 8.5 meters long "
             "and 6.2 meters wide. Please coordinate with your math specialist to "
             "get this done and explain the workflow."
         )
-        ok("Workflow coordination completed")
 
-        # Step 7: Test Complex Workflow
-        h2("Complex Workflow Testing")
-        step("Testing multi-step mathematical workflow...")
+        step("Collecting background workflows...")
+        math_response = math_agent.collect(math_task)
+        complex_response = coordinator_agent.collect(complex_task)
 
-        coordinator_agent.run(
-            "I need to solve this problem: A rectangular garden has a length of 12 meters "
-            "and a width of 8 meters. I want to add a path around it that's 1 meter wide. "
-            "What's the new total area? Please work through this step by step."
-        )
+        info(f"Response: {math_response[:100]}...")
+        expected_sum = f"{add_numbers(15, 27):g}"
+        if expected_sum in math_response:
+            ok(f"Math specialist answered {expected_sum} as computed locally")
+        else:
+            info(f"Local result {expected_sum} not found in the response")
+        ok("Math specialist executed successfully")
+        info(f"Response: {coordination_response[:100]}...")
+        info(f"Expected area (computed locally): {calculate_area(8.5, 6.2):g} m²")
+        ok("Workflow coordination completed")
+        info(f"Response: {complex_response[:100]}...")
         ok("Complex workflow completed")
 
         # Step 8: Workflow Summary
@@ -5,105 +5,178 @@ Goal: Demonstrate agent tool integration patterns including native tools, custom
 and sub-agent delegation with tools
 Estimated time: 10-15 minutes
 Prerequisites: Backend services running, valid API credentials
-Run: poetry run python examples/intermediate/sdk/04_agent_tool_integration.py
+Run: poetry run python examples/intermediate/sdk/04_agent_tool_integration.py [--sequential]
 Cleanup: Automatic cleanup of all created resources
 
 Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import functools
+import logging
 import sys
+import textwrap
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add the parent directory to sys.path to import shared utilities
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add the project root to sys.path to import shared utilities
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 from examples._shared import (
+    Step,
     fail,
+    get_client,
     h1,
     h2,
     info,
     load_env,
     ok,
+    parallel_create,
     print_run_info,
-    register_cleanup,
+    register_delete,
+    run_dag,
     step,
 )
-from glaip_sdk import Client
+from glaip_sdk import Agent, Client
+from glaip_sdk.config.constants import NO_RESPONSE_CONTENT
+
+_WEATHER_TOOL_TEMPLATE = textwrap.dedent(
+    """
+    from typing import Any
+    from gllm_plugin.tools import tool_plugin
+    from langchain_core.tools import BaseTool
+    from pydantic import BaseModel, Field
+
+    class WeatherToolInput(BaseModel):
+        location: str = Field(..., description="The city and state, e.g., San Francisco, CA")
+
+    @tool_plugin(version="1.0.0")
+    class WeatherTool(BaseTool):
+        name: str = "weather{suffix}"
+        description: str = "Useful for when you need to know the weather in a specific location."
+        args_schema: type[BaseModel] = WeatherToolInput
+
+        def _run(self, location: str, **kwargs: Any) -> str:
+            return f"The weather in {{location}} is sunny with a temperature of 22°C."
+    """
+)
 
 
+@functools.cache
 def create_custom_weather_tool(client: Client, suffix: str = "") -> str:
-    """Create a custom weather tool for testing."""
-    weather_tool_code = f"""
-from typing import Any
-from gllm_plugin.tools import tool_plugin
-from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
-
-class WeatherToolInput(BaseModel):
-    location: str = Field(..., description="The city and state, e.g., San Francisco, CA")
-
-@tool_plugin(version="1.0.0")
-class WeatherTool(BaseTool):
-    name: str = "weather{suffix}"
-    description: str = "Useful for when you need to know the weather in a specific location."
-    args_schema: type[BaseModel] = WeatherToolInput
-
-    def _run(self, location: str, **kwargs: Any) -> str:
-        return f"The weather in {{location}} is sunny with a temperature of 22°C."
-"""
+    """Create a custom weather tool for testing.
+
+    Results are cached per client and suffix within this process only, so
+    the tool is uploaded once per run. Tools created by other users or runs are
+    never reused, since the caller deletes the returned tool on exit.
+    """
+    name = f"custom_weather_tool{suffix}"
 
     # Use the new create_tool_from_code method which properly uploads tool plugins
     weather_tool = client.create_tool_from_code(
-        name=f"custom_weather_tool{suffix}",
-        code=weather_tool_code,
+        name=name,
+        code=_WEATHER_TOOL_TEMPLATE.format(suffix=suffix),
     )
 
     ok(f"Custom weather tool created: {weather_tool.name} (ID: {weather_tool.id})")
     return weather_tool.id
 
 
-def get_native_tools(client: Client) -> list[str]:
-    """Get available native tools for testing."""
-    step("Discovering available native tools...")
+def prepare_weather_tool(client: Client, suffix: str) -> None:
+    """Upload a weather tool ahead of the test phase that uses it.
 
+    A failed upload is only reported here: it is not cached, so the phase
+    retries it inside its own error handling and the other phases still run.
+    """
     try:
-        # Get all tools and filter for native ones
-        all_tools = client.list_tools()
-        native_tools = [tool for tool in all_tools if tool.tool_type == "native"]
-
-        if not native_tools:
-            info("No native tools found - this is normal in some environments")
-            return []
-
-        # Prioritize time and date tools as they're most reliable
-        time_tools = [tool for tool in native_tools if "time" in tool.name.lower()]
-        date_tools = [tool for tool in native_tools if "date" in tool.name.lower()]
-
-        selected_tools = []
-        if time_tools:
-            selected_tools.append(time_tools[0].id)
-            ok(f"Selected time tool: {time_tools[0].name}")
-        if date_tools:
-            selected_tools.append(date_tools[0].id)
-            ok(f"Selected date tool: {date_tools[0].name}")
-
-        # Add other simple tools if available
-        other_tools = [
-            tool for tool in native_tools if tool not in time_tools + date_tools
-        ]
-        if other_tools and len(selected_tools) < 2:
-            selected_tools.append(other_tools[0].id)
-            ok(f"Selected additional tool: {other_tools[0].name}")
+        create_custom_weather_tool(client, suffix)
+    except Exception as e:
+        info(f"Weather tool{suffix} upload failed, retrying in its test: {e}")
+
 
-        return selected_tools
+def get_native_tools(client: Client) -> list[str]:
+    """Get available native tools for testing.
 
+    Discovery runs once per client; later calls reuse the selection. Native
+    tools are built into the platform and none are created or deleted here, so
+    the cached selection stays valid for the whole run. A failed discovery is
+    not cached, so a later call tries again.
+    """
+    try:
+        return list(_discover_native_tools(client))
     except Exception as e:
         info(f"Could not discover native tools: {e}")
         return []
 
 
-def test_native_tools_only(client: Client) -> bool:
+@functools.lru_cache(maxsize=1)
+def _discover_native_tools(client: Client) -> tuple[str, ...]:
+    """List the backend's tools once and select native ones for testing.
+
+    Errors propagate so that ``lru_cache`` does not remember a failed listing.
+    """
+    step("Discovering available native tools...")
+
+    # Get all tools and filter for native ones
+    all_tools = client.list_tools()
+    native_tools = [tool for tool in all_tools if tool.tool_type == "native"]
+
+    if not native_tools:
+        info("No native tools found - this is normal in some environments")
+        return ()
+
+    # Prioritize time and date tools as they're most reliable; one pass
+    # partitions the catalog, lowering each name once
+    time_tools, date_tools, other_tools = [], [], []
+    for tool in native_tools:
+        name_lc = tool.name.lower()
+        if "time" in name_lc:
+            time_tools.append(tool)
+        elif "date" in name_lc:
+            date_tools.append(tool)
+        else:
+            other_tools.append(tool)
+
+    selected_tools = []
+    if time_tools:
+        selected_tools.append(time_tools[0].id)
+        ok(f"Selected time tool: {time_tools[0].name}")
+    if date_tools:
+        selected_tools.append(date_tools[0].id)
+        ok(f"Selected date tool: {date_tools[0].name}")
+
+    # Add other simple tools if available
+    if other_tools and len(selected_tools) < 2:
+        selected_tools.append(other_tools[0].id)
+        ok(f"Selected additional tool: {other_tools[0].name}")
+
+    return tuple(selected_tools)
+
+
+def run_until(agent: Agent, message: str, done: Callable[[str], bool]) -> str:
+    """Stream an agent run and stop as soon as ``done`` accepts a content event.
+
+    Each streamed content event replaces the previous one, as in
+    ``agent.run``, so ``done`` is checked against every event on its own rather
+    than against concatenated step and status output. Leaving early closes the
+    stream, which ends the run on the server.
+
+    Returns:
+        The latest content event: the one accepted by ``done``, or otherwise
+        the same final text ``agent.run`` would return
+    """
+    latest = ""
+    for content in agent.run_stream(message):
+        latest = content
+        if done(latest):
+            break
+    response = latest or NO_RESPONSE_CONTENT
+    info(f"Response: {response[:200]}...")
+    return response
+
+
+def test_native_tools_only(client: Client, renderer: str = "auto") -> bool:
     """Test agent with native tools only."""
     h2("Testing Native Tools Only")
 
@@ -127,15 +200,12 @@ def test_native_tools_only(client: Client) -> bool:
         )
         ok(f"Native tools agent created: {native_agent.name} (ID: {native_agent.id})")
 
-        # Register cleanup
-        register_cleanup(
-            lambda: client.delete_agent(native_agent.id),
-            f"delete_native_agent_{native_agent.id}",
-        )
+        # Queue deletion on exit
+        register_delete(client, "agent", native_agent.id)
 
         # Test basic functionality
         step("Testing native tool functionality...")
-        response = native_agent.run("What is the current time?")
+        response = native_agent.run("What is the current time?", renderer=renderer)
 
         if response and len(response) > 10:
             ok("Native tools test successful")
@@ -149,8 +219,12 @@ def test_native_tools_only(client: Client) -> bool:
         return False
 
 
-def test_custom_tool_integration(client: Client) -> bool:
-    """Test agent with custom tool integration."""
+def test_custom_tool_integration(client: Client, renderer: str = "auto") -> bool:
+    """Test agent with custom tool integration.
+
+    The check streams the run without rendering it, so ``renderer`` only keeps
+    the signature shared by all test phases.
+    """
     h2("Testing Custom Tool Integration")
 
     try:
@@ -158,11 +232,8 @@ def test_custom_tool_integration(client: Client) -> bool:
         step("Creating custom weather tool...")
         weather_tool_id = create_custom_weather_tool(client, "_main")
 
-        # Register cleanup
-        register_cleanup(
-            lambda: client.delete_tool(weather_tool_id),
-            f"delete_weather_tool_{weather_tool_id}",
-        )
+        # Queue deletion on exit
+        register_delete(client, "tool", weather_tool_id)
 
         # Create agent with custom tool
         step("Creating agent with custom weather tool...")
@@ -178,26 +249,28 @@ def test_custom_tool_integration(client: Client) -> bool:
         )
         ok(f"Custom tool agent created: {custom_agent.name} (ID: {custom_agent.id})")
 
-        # Register cleanup
-        register_cleanup(
-            lambda: client.delete_agent(custom_agent.id),
-            f"delete_custom_agent_{custom_agent.id}",
-        )
+        # Queue deletion on exit
+        register_delete(client, "agent", custom_agent.id)
 
         # Test custom tool functionality
         step("Testing custom weather tool...")
 
-        # Debug: Show tool details
-        tool_details = client.get_tool(weather_tool_id)
-        info(
-            f"Tool details: {tool_details.name}, type: {tool_details.tool_type}, framework: {tool_details.framework}"
-        )
-
-        # Debug: Show agent configuration
-        agent_details = client.get_agent(custom_agent.id)
-        info(f"Agent tools: {agent_details.tools}")
+        # Debug: Show tool details and agent configuration, fetched together
+        # and only when debug logging is enabled
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            tool_ref, agent_ref = ("tool", weather_tool_id), ("agent", custom_agent.id)
+            details = client.multi_get([tool_ref, agent_ref])
+            tool_details = details[tool_ref]
+            info(
+                f"Tool details: {tool_details.name}, type: {tool_details.tool_type}, framework: {tool_details.framework}"
+            )
+            info(f"Agent tools: {details[agent_ref].tools}")
 
-        response = custom_agent.run("What's the weather like in London?")
+        response = run_until(
+            custom_agent,
+            "What's the weather like in London?",
+            lambda text: "London" in text and "22°C" in text,
+        )
 
         # Check if the tool was actually used (should contain the exact tool output)
         if response and "London" in response and "22°C" in response:
@@ -214,62 +287,69 @@ def test_custom_tool_integration(client: Client) -> bool:
         return False
 
 
-def test_sub_agent_with_tools(client: Client) -> bool:
-    """Test sub-agent delegation with tools."""
+def test_sub_agent_with_tools(client: Client, renderer: str = "auto") -> bool:
+    """Test sub-agent delegation with tools.
+
+    The check streams the run without rendering it, so ``renderer`` only keeps
+    the signature shared by all test phases.
+    """
     h2("Testing Sub-Agent Delegation with Tools")
 
     try:
-        # Create custom weather tool
-        step("Creating weather tool for sub-agent...")
-        weather_tool_id = create_custom_weather_tool(client, "_sub")
+        # The weather tool upload and native tool discovery are independent,
+        # so they run concurrently before the sub-agents that need them.
+        step("Creating weather tool and discovering native tools for sub-agents...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            native_future = executor.submit(get_native_tools, client)
+            weather_tool_id = create_custom_weather_tool(client, "_sub")
+            native_tool_ids = native_future.result()
 
-        # Register cleanup
-        register_cleanup(
-            lambda: client.delete_tool(weather_tool_id),
-            f"delete_weather_tool_sub_{weather_tool_id}",
-        )
+        # Queue deletion on exit
+        register_delete(client, "tool", weather_tool_id)
 
         # Get native time tool
-        native_tool_ids = get_native_tools(client)
         time_tool_id = None
         if native_tool_ids:
             time_tool_id = native_tool_ids[0]  # Use first available native tool
 
-        # Create weather sub-agent
-        step("Creating weather sub-agent...")
-        weather_agent = client.create_agent(
-            name="weather-sub-agent",
-            instruction=(
-                "You are a weather expert. Always use your weather tool when asked about weather. "
-                "Provide clear, helpful weather information."
+        # The weather and time sub-agents do not depend on each other, so they
+        # are created concurrently; only the master agent needs both.
+        step("Creating sub-agents...")
+        sub_agent_specs = [
+            {
+                "kind": "agent",
+                "name": "weather-sub-agent",
+                "instruction": (
+                    "You are a weather expert. Always use your weather tool when asked about weather. "
+                    "Provide clear, helpful weather information."
+                ),
+                "tools": [weather_tool_id],
+            }
+        ]
+        if time_tool_id:
+            sub_agent_specs.append(
+                {
+                    "kind": "agent",
+                    "name": "time-sub-agent",
+                    "instruction": "You are a time expert. Use your time tool to provide current time information.",
+                    "tools": [time_tool_id],
+                }
+            )
+        # Each sub-agent is queued for deletion as soon as it exists, so one
+        # failed create does not leak the other
+        weather_agent, *rest = parallel_create(
+            client,
+            sub_agent_specs,
+            on_created=lambda kind, resource: register_delete(
+                client, kind, resource.id
             ),
-            tools=[weather_tool_id],
-        )
-        ok(f"Weather sub-agent created: {weather_agent.name} (ID: {weather_agent.id})")
-
-        # Register cleanup
-        register_cleanup(
-            lambda: client.delete_agent(weather_agent.id),
-            f"delete_weather_sub_agent_{weather_agent.id}",
         )
+        time_agent = rest[0] if rest else None
 
-        # Create time sub-agent (if native tools available)
-        time_agent = None
-        if time_tool_id:
-            step("Creating time sub-agent...")
-            time_agent = client.create_agent(
-                name="time-sub-agent",
-                instruction="You are a time expert. Use your time tool to provide current time information.",
-                tools=[time_tool_id],
-            )
+        ok(f"Weather sub-agent created: {weather_agent.name} (ID: {weather_agent.id})")
+        if time_agent:
             ok(f"Time sub-agent created: {time_agent.name} (ID: {time_agent.id})")
 
-            # Register cleanup
-            register_cleanup(
-                lambda: client.delete_agent(time_agent.id),
-                f"delete_time_sub_agent_{time_agent.id}",
-            )
-
         # Create master agent with sub-agents
         step("Creating master agent with sub-agents...")
         sub_agents = [weather_agent.id]
@@ -288,11 +368,8 @@ def test_sub_agent_with_tools(client: Client) -> bool:
         )
         ok(f"Master agent created: {master_agent.name} (ID: {master_agent.id})")
 
-        # Register cleanup
-        register_cleanup(
-            lambda: client.delete_agent(master_agent.id),
-            f"delete_master_agent_{master_agent.id}",
-        )
+        # Queue deletion on exit
+        register_delete(client, "agent", master_agent.id)
 
         # Test delegation with tools
         step("Testing sub-agent delegation with tools...")
@@ -301,7 +378,11 @@ def test_sub_agent_with_tools(client: Client) -> bool:
         else:
             query = "What is the weather like in Paris?"
 
-        response = master_agent.run(query)
+        response = run_until(
+            master_agent,
+            query,
+            lambda text: "Paris" in text and ("sunny" in text or "22°C" in text),
+        )
 
         # Validate response contains weather information
         if (
@@ -320,8 +401,12 @@ def test_sub_agent_with_tools(client: Client) -> bool:
         return False
 
 
-def main() -> bool:
-    """Main function demonstrating comprehensive agent tool integration."""
+def main(sequential: bool = False) -> bool:
+    """Main function demonstrating comprehensive agent tool integration.
+
+    Args:
+        sequential: Run the test phases one after another
+    """
     try:
         h1("Comprehensive Agent Tool Integration")
         print_run_info()
@@ -335,17 +420,49 @@ def main() -> bool:
         # Step 2: Client Initialization
         h2("Client Initialization")
         step("Creating AIP client...")
-        client = Client()
+        client = get_client()
         ok("Client created successfully")
 
-        # Step 3: Test Native Tools Only
-        native_tools_success = test_native_tools_only(client)
-
-        # Step 4: Test Custom Tool Integration
-        custom_tools_success = test_custom_tool_integration(client)
-
-        # Step 5: Test Sub-Agent Delegation with Tools
-        sub_agent_tools_success = test_sub_agent_with_tools(client)
+        # Steps 3-5: Native tools, custom tool integration and sub-agent
+        # delegation, run as a dependency graph. Native tool discovery and both
+        # weather tool uploads start at once; each test starts as soon as the
+        # shared resources it needs exist (their results are cached), so the
+        # run takes as long as its critical path. By default agent output is
+        # silent; pass --sequential to run one step at a time with streamed
+        # output.
+        renderer = "auto" if sequential else "silent"
+        results = run_dag(
+            [
+                Step("discover_native", lambda: get_native_tools(client)),
+                Step(
+                    "create_weather_main",
+                    lambda: prepare_weather_tool(client, "_main"),
+                ),
+                Step(
+                    "create_weather_sub",
+                    lambda: prepare_weather_tool(client, "_sub"),
+                ),
+                Step(
+                    "native_tools",
+                    lambda: test_native_tools_only(client, renderer),
+                    deps=("discover_native",),
+                ),
+                Step(
+                    "custom_tool",
+                    lambda: test_custom_tool_integration(client, renderer),
+                    deps=("create_weather_main",),
+                ),
+                Step(
+                    "sub_agents",
+                    lambda: test_sub_agent_with_tools(client, renderer),
+                    deps=("discover_native", "create_weather_sub"),
+                ),
+            ],
+            max_workers=1 if sequential else 4,
+        )
+        native_tools_success = results["native_tools"]
+        custom_tools_success = results["custom_tool"]
+        sub_agent_tools_success = results["sub_agents"]
 
         # Step 6: Overall Assessment
         h2("Overall Assessment")
@@ -380,5 +497,5 @@ def main() -> bool:
 
 
 if __name__ == "__main__":
-    success = main()
+    success = main(sequential="--sequential" in sys.argv[1:])
     sys.exit(0 if success else 1)
@@ -23,9 +23,12 @@ Examples are organized by complexity and interface type:
 import argparse
 import importlib.util
 import os
+import re
 import sys
 from pathlib import Path
 
+_COMPLEXITY_RE = re.compile(r"\[(BASIC|INTERMEDIATE|ADVANCED|DEMO)\]")
+
 
 class ExampleRunner:
     """Manages and runs AI Agent Platform examples."""
@@ -114,19 +117,9 @@ class ExampleRunner:
             lines = content.split("\n")
 
             # Look for complexity indicator in first few lines
-            for line in lines[:10]:
-                if "[BASIC]" in line:
-                    info["complexity"] = "BASIC"
-                    break
-                elif "[INTERMEDIATE]" in line:
-                    info["complexity"] = "INTERMEDIATE"
-                    break
-                elif "[ADVANCED]" in line:
-                    info["complexity"] = "ADVANCED"
-                    break
-                elif "[DEMO]" in line:
-                    info["complexity"] = "DEMO"
-                    break
+            complexity_match = _COMPLEXITY_RE.search("\n".join(lines[:10]))
+            if complexity_match:
+                info["complexity"] = complexity_match.group(1)
 
             # Look for description in docstring or comments
             for line in lines[:20]:
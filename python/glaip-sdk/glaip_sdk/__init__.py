@@ -4,9 +4,36 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
-from .client import Client
-from .exceptions import AIPError
-from .models import MCP, Agent, Tool
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .exceptions import AIPError
+    from .models import MCP, Agent, Tool
 
 __version__ = "0.1.1"
 __all__ = ["Client", "Agent", "Tool", "MCP", "AIPError"]
+
+# Public names resolved on first access (PEP 562), so importing the package
+# does not pull in httpx, rich and pydantic until they are actually needed
+_LAZY_ATTRS = {
+    "Client": ".client",
+    "Agent": ".models",
+    "Tool": ".models",
+    "MCP": ".models",
+    "AIPError": ".exceptions",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""On-disk response cache for AIP SDK agent runs.
+
+Authors:
+    Raymond Christopher (raymond.christopher@gdplabs.id)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_DIR = Path("~/.glaip/cache")
+
+
+class ResponseCache:
+    """Least-recently-used cache of final agent responses stored as files."""
+
+    def __init__(self, directory: str | Path | None = None, max_entries: int = 512):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding cache entries (defaults to ~/.glaip/cache)
+            max_entries: Number of entries kept before the oldest are evicted
+        """
+        self.directory = Path(directory or DEFAULT_CACHE_DIR).expanduser()
+        self.max_entries = max_entries
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        agent_id: str,
+        instruction: str | None,
+        tools: list[str],
+        agents: list[str],
+        model: dict[str, Any],
+        message: str,
+        **kwargs: Any,
+    ) -> str:
+        """Build a cache key from everything that determines an agent's answer.
+
+        Args:
+            agent_id: ID of the agent being run
+            instruction: Agent instruction
+            tools: Tool IDs attached to the agent
+            agents: Sub-agent IDs the agent can delegate to
+            model: Model settings (language model ID and agent config)
+            message: Message sent to the agent
+            **kwargs: Extra run parameters (e.g. chat_history)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        material = json.dumps(
+            {
+                "agent_id": agent_id,
+                "instruction": instruction,
+                "tools": sorted(tools),
+                "agents": sorted(agents),
+                "model": model,
+                "message": message,
+                "kwargs": kwargs,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(material.encode(), digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Refresh recency so eviction drops the least recently used entries
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store ``value`` under ``key``, evicting old entries if needed."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp, self._path(key))
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries = list(self.directory.glob("*.json"))
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:excess]:
+            path.unlink(missing_ok=True)
@@ -5,18 +5,47 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from glaip_sdk.cache import ResponseCache
 from glaip_sdk.client.agents import AgentClient
-from glaip_sdk.client.base import BaseClient
+from glaip_sdk.client.base import BaseClient, client_log
 from glaip_sdk.client.mcps import MCPClient
 from glaip_sdk.client.tools import ToolClient
+from glaip_sdk.exceptions import NotFoundError
 from glaip_sdk.models import MCP, Agent, Tool
 
 
+def _ignore_not_found(delete: Callable[[str], None]) -> Callable[[str], None]:
+    """Wrap a delete call so that an already-deleted resource is not an error."""
+
+    def _delete(resource_id: str) -> None:
+        try:
+            delete(resource_id)
+        except NotFoundError:
+            pass
+
+    return _delete
+
+
 class Client(BaseClient):
     """Main client that composes all specialized clients and shares one HTTP session."""
 
-    def __init__(self, **kwargs):
+    def __init__(self, *, cache: bool | str | Path = False, **kwargs):
+        """Initialize the client.
+
+        Args:
+            cache: Cache final agent responses on disk; pass a path to choose
+                the cache directory (defaults to ~/.glaip/cache)
+            **kwargs: Passed through to BaseClient
+        """
         super().__init__(**kwargs)
+        self.response_cache = None
+        if cache:
+            self.response_cache = ResponseCache(None if cache is True else cache)
         # Share the single httpx.Client + config with sub-clients
         shared_config = {
             "parent_client": self,
@@ -28,6 +57,11 @@ class Client(BaseClient):
         self.tools = ToolClient(**shared_config)
         self.mcps = MCPClient(**shared_config)
 
+    def close(self):
+        """Close the HTTP client once background agent runs have finished."""
+        self.agents.close()
+        super().close()
+
     # ---- Agents
     def list_agents(self) -> list[Agent]:
         agents = self.agents.list_agents()
@@ -154,6 +188,136 @@ class Client(BaseClient):
         """Run an agent with a message."""
         return self.agents.run_agent(agent_id, message, **kwargs)
 
+    def stream_agent(self, agent_id: str, message: str, **kwargs) -> Iterator[str]:
+        """Run an agent, yielding its content as it streams in."""
+        return self.agents.stream_agent(agent_id, message, **kwargs)
+
+    def run_batch(
+        self, agent_id: str, messages: Iterable[str], **kwargs
+    ) -> Iterator[str]:
+        """Run an agent on several messages concurrently, yielding results in order."""
+        return self.agents.run_batch(agent_id, messages, **kwargs)
+
+    def start_agent_run(self, agent_id: str, message: str, **kwargs) -> str:
+        """Start an agent run in the background and return its task ID."""
+        return self.agents.start_agent_run(agent_id, message, **kwargs)
+
+    def collect_agent_run(self, task_id: str, timeout: float | None = None) -> str:
+        """Wait for a background agent run and return its final response."""
+        return self.agents.collect_agent_run(task_id, timeout=timeout)
+
+    # ---- Bulk operations
+    def delete_many(
+        self,
+        refs: Iterable[tuple[str, str]],
+        max_workers: int = 8,
+        *,
+        missing_ok: bool = False,
+    ) -> None:
+        """Delete several resources concurrently over the shared HTTP client.
+
+        Duplicate refs are deleted once.
+
+        Args:
+            refs: ``(kind, id)`` pairs where kind is "agent", "tool" or "mcp"
+            max_workers: Maximum number of deletions in flight at once
+            missing_ok: Ignore resources that no longer exist
+
+        Raises:
+            ValueError: If a kind is not recognised
+            Exception: The first deletion error, after all deletions were attempted
+        """
+        deleters = {
+            "agent": self.delete_agent,
+            "tool": self.delete_tool,
+            "mcp": self.delete_mcp,
+        }
+        calls = []
+        for kind, resource_id in dict.fromkeys(refs):
+            if kind not in deleters:
+                raise ValueError(f"Unknown resource kind: {kind}")
+            calls.append((deleters[kind], resource_id))
+        if not calls:
+            return
+        if missing_ok:
+            calls = [(_ignore_not_found(delete), rid) for delete, rid in calls]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [
+                executor.submit(delete, resource_id) for delete, resource_id in calls
+            ]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            raise errors[0]
+
+    def multi_get(
+        self, refs: Iterable[tuple[str, str]], max_workers: int = 8
+    ) -> dict[tuple[str, str], Agent | Tool | MCP]:
+        """Fetch several resources concurrently over the shared HTTP client.
+
+        Args:
+            refs: ``(kind, id)`` pairs where kind is "agent", "tool" or "mcp"
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Fetched resources keyed by their ``(kind, id)`` pair
+
+        Raises:
+            ValueError: If a kind is not recognised
+        """
+        getters = {
+            "agent": self.get_agent_by_id,
+            "tool": self.get_tool_by_id,
+            "mcp": self.get_mcp_by_id,
+        }
+        refs = list(dict.fromkeys(refs))
+        for kind, _ in refs:
+            if kind not in getters:
+                raise ValueError(f"Unknown resource kind: {kind}")
+        if not refs:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(refs))) as executor:
+            futures = {ref: executor.submit(getters[ref[0]], ref[1]) for ref in refs}
+        return {ref: future.result() for ref, future in futures.items()}
+
+    def delete_agents(
+        self, agent_ids: Iterable[str], *, missing_ok: bool = False
+    ) -> None:
+        """Delete several agents concurrently."""
+        self.delete_many(
+            (("agent", agent_id) for agent_id in agent_ids), missing_ok=missing_ok
+        )
+
+    def delete_tools(
+        self, tool_ids: Iterable[str], *, missing_ok: bool = False
+    ) -> None:
+        """Delete several tools concurrently."""
+        self.delete_many(
+            (("tool", tool_id) for tool_id in tool_ids), missing_ok=missing_ok
+        )
+
+    def teardown(self, *resources: Agent | Tool | MCP) -> None:
+        """Delete agents, tools and MCPs together, e.g. at the end of a script.
+
+        Args:
+            *resources: Resource objects to delete
+        """
+        agent_refs = []
+        other_refs = []
+        for resource in resources:
+            if isinstance(resource, Agent):
+                agent_refs.append(("agent", resource.id))
+            elif isinstance(resource, Tool):
+                other_refs.append(("tool", resource.id))
+            elif isinstance(resource, MCP):
+                other_refs.append(("mcp", resource.id))
+            else:
+                raise TypeError(f"Cannot tear down {type(resource).__name__}")
+        # Agents go first so no tool or MCP is deleted while still referenced
+        self.delete_many(agent_refs)
+        self.delete_many(other_refs)
+
     # ---- Language Models
     def list_language_models(self) -> list[dict]:
         """List available language models."""
@@ -177,3 +341,22 @@ class Client(BaseClient):
             return True
         except Exception:
             return False
+
+    def warmup(self) -> threading.Thread:
+        """Open a pooled connection in the background before the first real call.
+
+        A health check on a daemon thread pays for connection setup and the
+        TLS handshake while the caller carries on, so the first API request
+        reuses a warm connection. Failures are logged and otherwise ignored.
+
+        Returns:
+            Thread running the health check (join it to wait for the warmup)
+        """
+
+        def _warmup() -> None:
+            if not self.ping():
+                client_log.debug("Connection warmup health check failed")
+
+        thread = threading.Thread(target=_warmup, name="glaip-warmup", daemon=True)
+        thread.start()
+        return thread
@@ -8,12 +8,17 @@ Authors:
 import json
 import logging
 import sys
+import threading
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any, BinaryIO
 
 import httpx
 from rich.console import Console
 
-from glaip_sdk.client.base import BaseClient
+from glaip_sdk.client.base import BaseClient, _encode_json_body
+from glaip_sdk.config.constants import NO_RESPONSE_CONTENT
 from glaip_sdk.models import Agent
 from glaip_sdk.utils.run_renderer import (
     RichStreamRenderer,
@@ -30,6 +35,10 @@ def _select_renderer(
     if isinstance(renderer, RichStreamRenderer):
         return renderer
 
+    if renderer == "silent":
+        # Discard all output, e.g. for runs executing concurrently
+        return RichStreamRenderer(console=Console(quiet=True), verbose=verbose)
+
     console = Console(file=sys.stdout, force_terminal=sys.stdout.isatty())
 
     if renderer in (None, "auto"):
@@ -58,6 +67,10 @@ class AgentClient(BaseClient):
             **kwargs: Additional arguments for standalone initialization
         """
         super().__init__(parent_client=parent_client, **kwargs)
+        # Background runs started by start_agent_run, keyed by task ID
+        self._background_runs: dict[str, Future] = {}
+        self._background_executor: ThreadPoolExecutor | None = None
+        self._background_lock = threading.Lock()
 
     def _extract_ids(self, items: list[str | Any] | None) -> list[str] | None:
         """Extract IDs from a list of objects or strings."""
@@ -278,13 +291,16 @@ class AgentClient(BaseClient):
         started_monotonic = None
         finished_monotonic = None
 
+        request_kwargs = _encode_json_body(
+            {
+                "json": payload if not files else None,
+                "data": form_data.get("data") if files else None,
+                "files": form_data.get("files") if files else None,
+                "headers": headers,
+            }
+        )
         with self.http_client.stream(
-            "POST",
-            f"/agents/{agent_id}/run",
-            json=payload if not files else None,
-            data=form_data.get("data") if files else None,
-            files=form_data.get("files") if files else None,
-            headers=headers,
+            "POST", f"/agents/{agent_id}/run", **request_kwargs
         ) as response:
             response.raise_for_status()
 
@@ -361,8 +377,152 @@ class AgentClient(BaseClient):
         st.finished_at = finished_monotonic or st.started_at
         st.usage = stats_usage
 
-        r.on_complete(final_text or "No response content received.", st)
-        return final_text or "No response content received."
+        r.on_complete(final_text or NO_RESPONSE_CONTENT, st)
+        return final_text or NO_RESPONSE_CONTENT
+
+    def stream_agent(self, agent_id: str, message: str, **kwargs) -> Iterator[str]:
+        """Run an agent and yield its content as it streams in.
+
+        Nothing is rendered; each assistant content event is yielded as soon as
+        it arrives so callers can act on partial output. Closing the iterator
+        early (e.g. breaking out of a loop) closes the connection, which ends
+        the run on the server.
+
+        Args:
+            agent_id: ID of the agent to run
+            message: Message to send to the agent
+            **kwargs: Additional payload fields (e.g. session_id)
+
+        Yields:
+            Assistant content from each content event
+        """
+        request_kwargs = _encode_json_body(
+            {
+                "json": {"input": message, **kwargs},
+                "headers": {"Accept": "text/event-stream"},
+            }
+        )
+        with self.http_client.stream(
+            "POST", f"/agents/{agent_id}/run", **request_kwargs
+        ) as response:
+            response.raise_for_status()
+            for event in self._iter_sse_events(response):
+                try:
+                    ev = json.loads(event["data"])
+                except json.JSONDecodeError:
+                    logger.debug("Non-JSON SSE fragment skipped")
+                    continue
+                if (ev.get("metadata") or {}).get("kind") == "artifact":
+                    continue
+                content = ev.get("content")
+                if content and not content.startswith("Artifact received:"):
+                    yield content
+
+    def run_batch(
+        self,
+        agent_id: str,
+        messages: Iterable[str],
+        *,
+        session_id: str | None = None,
+        max_workers: int = 4,
+        **kwargs,
+    ) -> Iterator[str]:
+        """Run an agent on several messages concurrently.
+
+        Runs share the pooled HTTP client and are rendered silently, since
+        concurrent live displays would interleave. Results are yielded in the
+        order of ``messages`` as soon as each run (and those before it) finishes.
+
+        Args:
+            agent_id: ID of the agent to run
+            messages: Messages to send, one run per message
+            session_id: Optional session ID shared by all runs
+            max_workers: Maximum number of runs in flight at once
+            **kwargs: Additional arguments forwarded to run_agent
+
+        Yields:
+            Final response text for each message
+        """
+        messages = list(messages)
+        if not messages:
+            return
+
+        if session_id is not None:
+            kwargs["session_id"] = session_id
+
+        def _run(message: str) -> str:
+            return self.run_agent(agent_id, message, renderer="silent", **kwargs)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(messages))
+        ) as executor:
+            yield from executor.map(_run, messages)
+
+    def start_agent_run(self, agent_id: str, message: str, **kwargs) -> str:
+        """Start an agent run in the background and return immediately.
+
+        The run executes on a worker thread over the pooled HTTP client and is
+        rendered silently unless a renderer is given. Use collect_agent_run to
+        wait for its result.
+
+        Args:
+            agent_id: ID of the agent to run
+            message: Message to send to the agent
+            **kwargs: Additional arguments forwarded to run_agent
+
+        Returns:
+            Task ID identifying the background run
+        """
+        kwargs.setdefault("renderer", "silent")
+        with self._background_lock:
+            if self._background_executor is None:
+                self._background_executor = ThreadPoolExecutor(
+                    thread_name_prefix="glaip-run"
+                )
+            task_id = uuid.uuid4().hex
+            self._background_runs[task_id] = self._background_executor.submit(
+                self.run_agent, agent_id, message, **kwargs
+            )
+        return task_id
+
+    def collect_agent_run(self, task_id: str, timeout: float | None = None) -> str:
+        """Wait for a background run and return its final response.
+
+        A finished run is forgotten once collected, whether it succeeded or
+        raised. A run still going when ``timeout`` expires is kept, so it can
+        be collected again later.
+
+        Args:
+            task_id: Task ID returned by start_agent_run
+            timeout: Seconds to wait before giving up (None waits indefinitely)
+
+        Returns:
+            Final response text of the run
+
+        Raises:
+            KeyError: If the task ID is unknown or was already collected
+            TimeoutError: If the run does not finish within ``timeout``
+            Exception: Whatever the run itself raised
+        """
+        with self._background_lock:
+            future = self._background_runs[task_id]
+        done, _ = wait([future], timeout=timeout)
+        if not done:
+            raise TimeoutError(f"Background run {task_id} is still running")
+        with self._background_lock:
+            self._background_runs.pop(task_id, None)
+        return future.result()
+
+    def close(self):
+        """Wait for background runs to finish, then close the HTTP client.
+
+        Runs not yet started are cancelled, so no run uses a closed client.
+        """
+        with self._background_lock:
+            executor, self._background_executor = self._background_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        super().close()
 
     def _iter_sse_events(self, response: httpx.Response):
         """Iterate over Server-Sent Events with proper parsing."""
@@ -5,6 +5,7 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import functools
 import logging
 import os
 from typing import Any, Union
@@ -23,6 +24,20 @@ from glaip_sdk.exceptions import (
     ValidationError,
 )
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 # Set up logging without basicConfig (library best practice)
 logger = logging.getLogger("glaip_sdk")
 logger.addHandler(logging.NullHandler())
@@ -30,6 +45,36 @@ logger.addHandler(logging.NullHandler())
 client_log = logging.getLogger("glaip_sdk.client")
 client_log.addHandler(logging.NullHandler())
 
+# Seconds an idle pooled connection is kept before being released
+KEEPALIVE_EXPIRY = 300.0
+
+
+def _encode_json_body(request_kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Pre-encode a ``json=`` request body with orjson when it is installed.
+
+    Args:
+        request_kwargs: Keyword arguments destined for an httpx request
+
+    Returns:
+        The arguments, with ``json`` replaced by encoded ``content`` if possible
+    """
+    if not ORJSON_AVAILABLE or request_kwargs.get("json") is None:
+        return request_kwargs
+    request_kwargs = dict(request_kwargs)
+    body = request_kwargs.pop("json")
+    request_kwargs["content"] = orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+    request_kwargs["headers"] = {
+        "Content-Type": "application/json",
+        **(request_kwargs.get("headers") or {}),
+    }
+    return request_kwargs
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """Load .env once per process instead of searching for it on every client."""
+    load_dotenv()
+
 
 class BaseClient:
     """Base client with HTTP operations and authentication."""
@@ -40,6 +85,8 @@ class BaseClient:
         api_key: str | None = None,
         timeout: float = 30.0,
         *,
+        pool_size: int = 10,
+        http2: bool | None = None,
         parent_client: Union["BaseClient", None] = None,
         load_env: bool = True,
     ):
@@ -49,6 +96,9 @@ class BaseClient:
             api_url: API base URL
             api_key: API authentication key
             timeout: Request timeout in seconds
+            pool_size: Number of keep-alive connections kept in the HTTP pool
+            http2: Negotiate HTTP/2 so concurrent requests share one connection;
+                defaults to enabled when the optional ``h2`` package is installed
             parent_client: Parent client to adopt session/config from
             load_env: Whether to load environment variables
         """
@@ -60,15 +110,19 @@ class BaseClient:
             self.api_url = parent_client.api_url
             self.api_key = parent_client.api_key
             self._timeout = parent_client._timeout
+            self._pool_size = parent_client._pool_size
+            self._http2 = parent_client._http2
             self.http_client = parent_client.http_client
         else:
             # Initialize as standalone client
             if load_env:
-                load_dotenv()
+                _load_dotenv_once()
 
             self.api_url = api_url or os.getenv("AIP_API_URL")
             self.api_key = api_key or os.getenv("AIP_API_KEY")
             self._timeout = timeout
+            self._pool_size = pool_size
+            self._http2 = H2_AVAILABLE if http2 is None else http2
 
             if not self.api_url:
                 client_log.error("AIP_API_URL not found in environment or parameters")
@@ -92,8 +146,14 @@ class BaseClient:
             },
             timeout=httpx.Timeout(timeout),
             follow_redirects=True,
-            http2=False,
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=100),
+            http2=self._http2,
+            # Keep idle connections around between long-running agent calls
+            # instead of reconnecting after httpx's default 5s expiry.
+            limits=httpx.Limits(
+                max_keepalive_connections=self._pool_size,
+                max_connections=100,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
         )
 
     @property
@@ -116,6 +176,7 @@ class BaseClient:
     def _request(self, method: str, endpoint: str, **kwargs) -> Any:
         """Make HTTP request with error handling."""
         client_log.debug(f"Making {method} request to {endpoint}")
+        kwargs = _encode_json_body(kwargs)
         try:
             response = self.http_client.request(method, endpoint, **kwargs)
             client_log.debug(f"Response status: {response.status_code}")
@@ -12,6 +12,9 @@ DEFAULT_MODEL_PROVIDER = "openai"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_AGENT_TIMEOUT = 300.0
 
+# Text returned by an agent run whose stream carried no content
+NO_RESPONSE_CONTENT = "No response content received."
+
 # User agent
 SDK_NAME = "glaip-sdk"
 SDK_VERSION = "0.1.1"
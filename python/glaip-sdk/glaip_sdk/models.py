@@ -5,10 +5,18 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import asyncio
+from collections.abc import Iterator
 from typing import Any
 
 from pydantic import BaseModel
 
+from glaip_sdk.cache import ResponseCache
+from glaip_sdk.config.constants import NO_RESPONSE_CONTENT
+
+# Run options that affect presentation only and never the agent's answer
+_UNCACHED_RUN_KWARGS = frozenset({"agent_name", "renderer", "verbose", "tty"})
+
 
 class Agent(BaseModel):
     """Agent model for API responses."""
@@ -34,15 +42,107 @@ class Agent(BaseModel):
         self._client = client
         return self
 
-    def run(self, message: str, **kwargs) -> str:
-        """Run the agent with a message."""
+    def run(self, message: str, *, background: bool = False, **kwargs) -> str:
+        """Run the agent with a message.
+
+        Args:
+            message: Message to send to the agent
+            background: Start the run without waiting for it and return a task
+                ID to pass to collect() instead of the response
+            **kwargs: Additional arguments forwarded to the client
+
+        Returns:
+            Final response text, or the task ID when ``background`` is set
+        """
         if not self._client:
             raise RuntimeError(
                 "No client available. Use client.get_agent_by_id() to get a client-connected agent."
             )
         # Automatically pass the agent name for better renderer display
         kwargs.setdefault("agent_name", self.name)
-        return self._client.run_agent(self.id, message, **kwargs)
+
+        if background:
+            return self._client.start_agent_run(self.id, message, **kwargs)
+
+        cache = getattr(self._client, "response_cache", None)
+        if not isinstance(cache, ResponseCache) or kwargs.get("files"):
+            return self._client.run_agent(self.id, message, **kwargs)
+
+        key = cache.make_key(
+            self.id,
+            self.instruction,
+            [tool.get("id") for tool in self.tools or []],
+            [agent.get("id") for agent in self.agents or []],
+            {
+                "language_model_id": self.language_model_id,
+                "agent_config": self.agent_config,
+            },
+            message,
+            **{k: v for k, v in kwargs.items() if k not in _UNCACHED_RUN_KWARGS},
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._client.run_agent(self.id, message, **kwargs)
+        # Empty or failed streams are not cached, so later calls retry them
+        if result and result != NO_RESPONSE_CONTENT:
+            cache.set(key, result)
+        return result
+
+    def run_stream(self, message: str, **kwargs) -> Iterator[str]:
+        """Run the agent and yield its content as it streams in.
+
+        Breaking out of the loop early closes the stream and ends the run.
+
+        Args:
+            message: Message to send to the agent
+            **kwargs: Additional arguments forwarded to the client
+
+        Yields:
+            Assistant content from each content event
+        """
+        if not self._client:
+            raise RuntimeError(
+                "No client available. Use client.get_agent_by_id() to get a client-connected agent."
+            )
+        yield from self._client.stream_agent(self.id, message, **kwargs)
+
+    def collect(self, task_id: str, timeout: float | None = None) -> str:
+        """Wait for a run started with ``run(..., background=True)``.
+
+        Args:
+            task_id: Task ID returned by the background run
+            timeout: Seconds to wait before giving up (None waits indefinitely)
+
+        Returns:
+            Final response text of the run
+        """
+        if not self._client:
+            raise RuntimeError(
+                "No client available. Use client.get_agent_by_id() to get a client-connected agent."
+            )
+        return self._client.collect_agent_run(task_id, timeout=timeout)
+
+    def run_batch(self, messages: list[str], **kwargs) -> list[str]:
+        """Run the agent on several messages concurrently.
+
+        Args:
+            messages: Messages to send, one run per message
+            **kwargs: Additional arguments forwarded to each run
+
+        Returns:
+            Final response text for each message, in order
+        """
+        if not self._client:
+            raise RuntimeError(
+                "No client available. Use client.get_agent_by_id() to get a client-connected agent."
+            )
+        kwargs.setdefault("agent_name", self.name)
+        return list(self._client.run_batch(self.id, messages, **kwargs))
+
+    async def run_batch_async(self, messages: list[str], **kwargs) -> list[str]:
+        """Run the agent on several messages concurrently without blocking the event loop."""
+        return await asyncio.to_thread(self.run_batch, messages, **kwargs)
 
     def update(self, **kwargs) -> "Agent":
         """Update agent attributes."""
@@ -5,7 +5,7 @@ Authors:
 """
 
 import re
-from uuid import UUID
+import string
 
 from .run_renderer import (
     RichStreamRenderer,
@@ -25,6 +25,20 @@ __all__ = [
     "progress_bar",
 ]
 
+# Maps every ASCII character outside [a-zA-Z0-9_-] to "-" and folds uppercase
+_SANITIZE_TABLE = str.maketrans(
+    {
+        **{c: "-" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")},
+        **{c: c.lower() for c in string.ascii_uppercase},
+    }
+)
+_DASHES_PATTERN = re.compile(r"-+")
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_DIVISORS = tuple(1024**i for i in range(len(_SIZE_UNITS)))
+
 
 def is_uuid(value: str) -> bool:
     """Check if a string is a valid UUID.
@@ -35,12 +49,19 @@ def is_uuid(value: str) -> bool:
     Returns:
         True if value is a valid UUID, False otherwise
     """
-    try:
-        UUID(value)
-        return True
-    except (ValueError, TypeError):
+    if type(value) is not str:
         return False
 
+    # Accept the canonical 8-4-4-4-12 form and the bare 32-digit hex form
+    if len(value) == 36:
+        if not (value[8] == value[13] == value[18] == value[23] == "-"):
+            return False
+        value = value[:8] + value[9:13] + value[14:18] + value[19:23] + value[24:]
+    elif len(value) != 32:
+        return False
+
+    return _HEX_DIGITS.issuperset(value)
+
 
 def sanitize_name(name: str) -> str:
     """Sanitize a name for resource creation.
@@ -51,10 +72,13 @@ def sanitize_name(name: str) -> str:
     Returns:
         Sanitized name suitable for resource creation
     """
-    # Remove special characters and normalize
-    sanitized = re.sub(r"[^a-zA-Z0-9\-_]", "-", name.strip())
-    sanitized = re.sub(r"-+", "-", sanitized)  # Collapse multiple dashes
-    return sanitized.lower().strip("-")
+    if not name:
+        return ""
+
+    # Non-ASCII characters become "?" so the table maps them to dashes too
+    sanitized = name.encode("ascii", "replace").decode("ascii")
+    sanitized = sanitized.translate(_SANITIZE_TABLE)
+    return _DASHES_PATTERN.sub("-", sanitized).strip("-")
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -66,11 +90,12 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Human readable size string (e.g., "1.5 MB")
     """
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        index = 0
+    else:
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / _SIZE_DIVISORS[index]:.1f} {_SIZE_UNITS[index]}"
 
 
 def progress_bar(iterable, description: str = "Processing"):
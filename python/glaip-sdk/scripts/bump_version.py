@@ -13,21 +13,60 @@ Usage:
     python scripts/bump_version.py --dry-run patch  # Preview changes
 """
 
+import os
 import sys
 import subprocess
 import argparse
 from pathlib import Path
 
+# Directory holding .bumpversion.cfg, located once by _find_repo_root()
+_REPO_ROOT = None
+
+
+def _find_repo_root():
+    """Find the nearest directory above this script containing .bumpversion.cfg."""
+    global _REPO_ROOT
+    if _REPO_ROOT is None:
+        script_dir = Path(__file__).resolve().parent
+        for candidate in (script_dir, *script_dir.parents):
+            if (candidate / ".bumpversion.cfg").is_file():
+                _REPO_ROOT = candidate
+                break
+    return _REPO_ROOT
+
 
 def run_bump2version(version_type, dry_run=False):
     """Run bump2version with the specified version type."""
-    cmd = ["bump2version"]
+    args = []
     
     if dry_run:
-        cmd.append("--dry-run")
-        cmd.append("--verbose")
+        args.append("--dry-run")
+        args.append("--verbose")
+
+    args.append(version_type)
     
-    cmd.append(version_type)
+    try:
+        # Call bump2version in-process to skip starting a second interpreter
+        from bumpversion.cli import main as bumpversion_main
+    except ImportError:
+        return _run_bump2version_subprocess(args)
+
+    try:
+        bumpversion_main(args)
+        return True
+    except SystemExit as e:
+        if e.code in (None, 0):
+            return True
+        print(f"Error running bump2version: exit code {e.code}")
+        return False
+    except Exception as e:
+        print(f"Error running bump2version: {e}")
+        return False
+
+
+def _run_bump2version_subprocess(args):
+    """Run the bump2version executable when the package is not importable."""
+    cmd = ["bump2version", *args]
     
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
@@ -57,11 +96,13 @@ def main():
     
     args = parser.parse_args()
     
-    # Check if we're in the right directory
-    if not Path(".bumpversion.cfg").exists():
+    # Run from the project root so this works from any directory
+    repo_root = _find_repo_root()
+    if repo_root is None:
         print("❌ Error: .bumpversion.cfg not found!")
-        print("   Make sure you're running this from the project root directory.")
+        print("   Make sure this script lives inside the project.")
         sys.exit(1)
+    os.chdir(repo_root)
     
     print(f"🚀 Bumping {args.version_type} version...")
     if args.dry_run:
@@ -9,9 +9,100 @@ Authors:
 """
 
 import argparse
-import re
+import codecs
+import functools
+import io
+import json
+import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TextIO
+
+try:
+    # Linear-time engine without backtracking, used when installed
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# Header patterns, compiled once and shared by every parse. Flags are inline
+# so the patterns compile the same under re and re2
+_DOCSTRING_RE = _re.compile(r'(?s)"""(.*?)"""')
+_COMPLEXITY_RE = _re.compile(r"\[(BASIC|INTERMEDIATE|ADVANCED|DEMO)\]")
+
+# Parsed headers are cached next to the generated docs; bump the version
+# whenever parsing changes so stale entries are discarded
+HEADER_CACHE_FILENAME = ".example_header_cache.json"
+HEADER_CACHE_VERSION = 3
+
+# Module docstrings sit at the top of SDK examples, so only this much of each
+# file is read unless the docstring runs past it
+_SDK_HEAD_BYTES = 16 * 1024
+
+# Header key -> info field holding its single-line value
+_HEADER_FIELDS = {
+    "Goal": "goal",
+    "Estimated time": "time",
+    "Run": "run_command",
+    "Cleanup": "cleanup",
+}
+# Every header key; parsing stops once all of them have been seen
+_HEADER_KEYS = frozenset({*_HEADER_FIELDS, "Prerequisites", "Authors"})
+
+# One alternation over every header key, so a single scan of the text finds
+# all header lines instead of testing each line in Python
+_KEY_ALTERNATION = "|".join(sorted(_HEADER_KEYS, key=len, reverse=True))
+_SDK_HEADER_RE = _re.compile(rf"(?m)^[ \t]*(?P<key>{_KEY_ALTERNATION}):(?P<value>.*)")
+_CLI_HEADER_RE = _re.compile(
+    rf"(?m)^[ \t]*\*\*(?P<key>{_KEY_ALTERNATION})\*\*:(?P<value>.*)"
+)
+
+# Display names for the example interfaces
+_INTERFACE_NAMES = {"sdk": "Python SDK", "cli": "CLI"}
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty(name: str) -> str:
+    """Turn a directory name like ``getting-started`` into a heading."""
+    return name.replace("-", " ").title()
+
+
+def _line_writer(out: TextIO) -> Callable[..., None]:
+    """Return a function writing lines to ``out``, separated like ``"\\n".join``."""
+    first = True
+
+    def write_line(line: str = "") -> None:
+        nonlocal first
+        if not first:
+            out.write("\n")
+        first = False
+        out.write(line)
+
+    return write_line
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` to ``path`` unless the file already holds it.
+
+    Leaving identical files untouched keeps their mtime, so incremental doc
+    builds do not rebuild pages that did not change.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+# Example files keyed by (category, interface)
+ExampleFiles = dict[tuple[str, str], list[Path]]
 
 
 class ExampleDocGenerator:
@@ -22,9 +113,84 @@ class ExampleDocGenerator:
         self.output_dir = output_dir
         self.categories = ["getting-started", "intermediate", "advanced", "demos"]
         self.interfaces = ["sdk", "cli"]
+        self.header_cache_file = output_dir / HEADER_CACHE_FILENAME
+        self._header_cache = self._load_header_cache()
+        self._used_headers: dict[str, dict] = {}
+        self._parsed_headers: dict[tuple[Path, str], dict] = {}
+
+    def _load_header_cache(self) -> dict[str, dict]:
+        """Load headers parsed by a previous run, if still valid."""
+        try:
+            cached = json.loads(self.header_cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(cached, dict)
+            or cached.get("version") != HEADER_CACHE_VERSION
+        ):
+            return {}
+        return cached.get("headers", {})
+
+    def _save_header_cache(self) -> None:
+        """Persist the headers used by this run for the next one.
+
+        Keys are sorted so the file does not depend on which worker finished
+        first, and an unchanged cache is not rewritten.
+        """
+        _write_if_changed(
+            self.header_cache_file,
+            json.dumps(
+                {"version": HEADER_CACHE_VERSION, "headers": self._used_headers},
+                sort_keys=True,
+            ),
+        )
 
     def parse_example_header(self, file_path: Path, interface: str) -> dict[str, str]:
-        """Parse example file header for documentation."""
+        """Parse example file header for documentation.
+
+        Results are cached by path, modification time and size, so unchanged
+        files are not read again on later runs.
+        """
+        try:
+            st = file_path.stat()
+        except OSError:
+            st = None
+        if st is not None:
+            key = f"{file_path}:{interface}:{st.st_mtime_ns}:{st.st_size}"
+            info = self._header_cache.get(key) or self._used_headers.get(key)
+            if info is None:
+                info = self._parse_example_header(file_path, interface)
+            self._used_headers[key] = info
+            return info
+        return self._parse_example_header(file_path, interface)
+
+    def _header(self, file_path: Path, interface: str) -> dict:
+        """Return a header parsed ahead by parse_all_headers, or parse it now."""
+        info = self._parsed_headers.get((file_path, interface))
+        if info is None:
+            info = self.parse_example_header(file_path, interface)
+        return info
+
+    def parse_all_headers(self, examples: ExampleFiles) -> None:
+        """Parse the headers of all discovered examples concurrently.
+
+        Reading and parsing each file is independent, so the files are spread
+        over a thread pool; the generators then reuse the parsed headers.
+        """
+        tasks = [
+            (file_path, interface)
+            for (_, interface), files in examples.items()
+            for file_path in files
+        ]
+        if not tasks:
+            return
+        workers = min(32, (os.cpu_count() or 1) * 4, len(tasks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            headers = executor.map(lambda t: self.parse_example_header(*t), tasks)
+            self._parsed_headers.update(zip(tasks, headers, strict=True))
+
+    def _parse_example_header(self, file_path: Path, interface: str) -> dict[str, str]:
+        """Parse example file header for documentation, without caching."""
         info = {
             "title": file_path.stem,
             "goal": "No goal specified",
@@ -37,255 +203,246 @@ class ExampleDocGenerator:
         }
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-
             if interface == "sdk":
                 # Parse Python file docstring
-                docstring_match = re.search(r'"""(.*?)"""', content, re.DOTALL)
+                with file_path.open("rb") as f:
+                    head = f.read(_SDK_HEAD_BYTES)
+                    # Incremental decoding tolerates a character cut at the end
+                    content = codecs.getincrementaldecoder("utf-8")().decode(head)
+                    docstring_match = _DOCSTRING_RE.search(content)
+                    if not docstring_match and len(head) == _SDK_HEAD_BYTES:
+                        content = (head + f.read()).decode("utf-8")
+                        docstring_match = _DOCSTRING_RE.search(content)
                 if not docstring_match:
                     return info
 
                 docstring = docstring_match.group(1)
-                lines = docstring.split("\n")
-
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("Goal:"):
-                        info["goal"] = line[5:].strip()
-                    elif line.startswith("Estimated time:"):
-                        info["time"] = line[15:].strip()
-                    elif line.startswith("Prerequisites:"):
+
+                seen: set[str] = set()
+                for match in _SDK_HEADER_RE.finditer(docstring):
+                    key = match.group("key")
+                    seen.add(key)
+                    field = _HEADER_FIELDS.get(key)
+                    if field:
+                        info[field] = match.group("value").strip()
+                    elif key == "Prerequisites":
                         # Collect all prerequisite lines
                         info["prerequisites"] = []
-                        for prereq_line in lines[lines.index(line) + 1 :]:
-                            if prereq_line.strip().startswith("-"):
-                                info["prerequisites"].append(
-                                    prereq_line.strip()[1:].strip()
-                                )
-                            elif (
-                                prereq_line.strip()
-                                and not line.strip().startswith("Run:")
-                                and not line.strip().startswith("Cleanup:")
+                        rest = docstring[match.end() + 1 :]
+                        for prereq_line in rest.split("\n"):
+                            prereq = prereq_line.strip()
+                            if prereq.startswith("-"):
+                                info["prerequisites"].append(prereq[1:].strip())
+                            elif prereq and not prereq.startswith(
+                                ("Run:", "Cleanup:", "Authors:")
                             ):
                                 break
-                    elif line.startswith("Run:"):
-                        info["run_command"] = line[4:].strip()
-                    elif line.startswith("Cleanup:"):
-                        info["cleanup"] = line[8:].strip()
-                    elif line.startswith("Authors:"):
-                        # Collect author lines
+                    elif key == "Authors":
+                        # Collect indented author lines
                         info["authors"] = []
-                        for author_line in lines[lines.index(line) + 1 :]:
-                            if author_line.strip().startswith("    "):
-                                info["authors"].append(author_line.strip())
-                            elif line.strip() and not line.strip().startswith("    "):
+                        rest = docstring[match.end() + 1 :]
+                        for author_line in rest.split("\n"):
+                            author = author_line.strip()
+                            if author and author_line[:1].isspace():
+                                info["authors"].append(author)
+                            elif author or info["authors"]:
                                 break
+                    if len(seen) == len(_HEADER_KEYS):
+                        break
             else:
                 # Parse CLI Markdown file
-                lines = content.split("\n")
-
-                for i, line in enumerate(lines):
-                    line = line.strip()
-                    if line.startswith("**Goal**:"):
-                        info["goal"] = line[8:].strip()
-                    elif line.startswith("**Estimated time**:"):
-                        info["time"] = line[19:].strip()
-                    elif line.startswith("**Prerequisites**:"):
+                content = file_path.read_bytes().decode("utf-8")
+                seen: set[str] = set()
+                for match in _CLI_HEADER_RE.finditer(content):
+                    key = match.group("key")
+                    seen.add(key)
+                    field = _HEADER_FIELDS.get(key)
+                    if field:
+                        info[field] = match.group("value").strip()
+                    elif key == "Prerequisites":
                         # Collect all prerequisite lines
                         info["prerequisites"] = []
-                        for prereq_line in lines[i + 1 :]:
-                            if prereq_line.strip().startswith("-"):
-                                info["prerequisites"].append(
-                                    prereq_line.strip()[1:].strip()
-                                )
-                            elif (
-                                prereq_line.strip()
-                                and not prereq_line.strip().startswith("**")
-                            ):
+                        rest = content[match.end() + 1 :]
+                        for prereq_line in rest.split("\n"):
+                            prereq = prereq_line.strip()
+                            if prereq.startswith("-"):
+                                info["prerequisites"].append(prereq[1:].strip())
+                            elif prereq and not prereq.startswith("**"):
                                 break
-                    elif line.startswith("**Run**:"):
-                        info["run_command"] = line[7:].strip()
-                    elif line.startswith("**Cleanup**:"):
-                        info["cleanup"] = line[11:].strip()
-                    elif line.startswith("**Authors**:"):
+                    elif key == "Authors":
                         # Collect author lines
                         info["authors"] = []
-                        for author_line in lines[i + 1 :]:
-                            if author_line.strip().startswith("-"):
-                                info["authors"].append(author_line.strip()[1:].strip())
-                            elif (
-                                author_line.strip()
-                                and not author_line.strip().startswith("**")
-                            ):
+                        rest = content[match.end() + 1 :]
+                        for author_line in rest.split("\n"):
+                            author = author_line.strip()
+                            if author.startswith("-"):
+                                info["authors"].append(author[1:].strip())
+                            elif author and not author.startswith("**"):
                                 break
+                    if len(seen) == len(_HEADER_KEYS):
+                        break
 
-            # Detect complexity from filename or content
-            if "[BASIC]" in content:
-                info["complexity"] = "BASIC"
-            elif "[INTERMEDIATE]" in content:
-                info["complexity"] = "INTERMEDIATE"
-            elif "[ADVANCED]" in content:
-                info["complexity"] = "ADVANCED"
-            elif "[DEMO]" in content:
-                info["complexity"] = "DEMO"
+            # Detect complexity from content
+            complexity_match = _COMPLEXITY_RE.search(content)
+            if complexity_match:
+                info["complexity"] = complexity_match.group(1)
 
         except Exception as e:
             print(f"Warning: Could not parse {file_path}: {e}")
 
         return info
 
-    def generate_markdown_doc(self, examples: dict[str, dict[str, list[Path]]]) -> str:
+    def _by_category(
+        self, examples: ExampleFiles
+    ) -> list[tuple[str, list[tuple[str, list[Path]]]]]:
+        """Group the flat example mapping by category in a single pass.
+
+        Every known category is present, in display order, even when it has
+        no examples; interfaces keep their discovery order.
+        """
+        grouped: dict[str, list[tuple[str, list[Path]]]] = {
+            category: [] for category in self.categories
+        }
+        for (category, interface), files in examples.items():
+            if files:
+                grouped.setdefault(category, []).append((interface, files))
+        return list(grouped.items())
+
+    def generate_markdown_doc(self, examples: ExampleFiles) -> str:
         """Generate Markdown documentation."""
-        md_content = []
+        out = io.StringIO()
+        self._write_markdown_doc(examples, out)
+        return out.getvalue()
+
+    def _write_markdown_doc(self, examples: ExampleFiles, out: TextIO) -> None:
+        """Write Markdown documentation to ``out``."""
+        write_line = _line_writer(out)
 
         # Header
-        md_content.append("# AI Agent Platform Examples")
-        md_content.append("")
-        md_content.append("This documentation is auto-generated from example files.")
-        md_content.append("")
+        write_line("# AI Agent Platform Examples")
+        write_line("")
+        write_line("This documentation is auto-generated from example files.")
+        write_line("")
 
         # Table of Contents
-        md_content.append("## Table of Contents")
-        md_content.append("")
+        write_line("## Table of Contents")
+        write_line("")
         for category in self.categories:
-            if category in examples:
-                md_content.append(
-                    f"- [{category.replace('-', ' ').title()}](#{category.replace('-', '-')})"
-                )
-        md_content.append("")
+            write_line(f"- [{_pretty(category)}](#{category})")
+        write_line("")
 
         # Generate content for each category
-        for category in self.categories:
-            if category not in examples:
-                continue
-
-            # Check if category has any examples
-            has_examples = False
-            for interface in self.interfaces:
-                if examples[category][interface]:
-                    has_examples = True
-                    break
-
-            if not has_examples:
+        for category, entries in self._by_category(examples):
+            if not entries:
                 continue
 
-            md_content.append(f"## {category.replace('-', ' ').title()}")
-            md_content.append("")
-
-            for interface in self.interfaces:
-                files = examples[category][interface]
-                if not files:
-                    continue
+            write_line(f"## {_pretty(category)}")
+            write_line("")
 
-                interface_name = "Python SDK" if interface == "sdk" else "CLI"
-                md_content.append(f"### {interface_name}")
-                md_content.append("")
+            for interface, files in entries:
+                interface_name = _INTERFACE_NAMES[interface]
+                write_line(f"### {interface_name}")
+                write_line("")
 
                 for file_path in files:
-                    info = self.parse_example_header(file_path, interface)
+                    info = self._header(file_path, interface)
 
-                    md_content.append(f"#### {info['title']}")
-                    md_content.append("")
-                    md_content.append(f"**Goal:** {info['goal']}")
-                    md_content.append("")
-                    md_content.append(f"**Estimated time:** {info['time']}")
-                    md_content.append("")
-                    md_content.append(f"**Complexity:** {info['complexity']}")
-                    md_content.append("")
+                    write_line(f"#### {info['title']}")
+                    write_line("")
+                    write_line(f"**Goal:** {info['goal']}")
+                    write_line("")
+                    write_line(f"**Estimated time:** {info['time']}")
+                    write_line("")
+                    write_line(f"**Complexity:** {info['complexity']}")
+                    write_line("")
 
                     if info["prerequisites"]:
-                        md_content.append("**Prerequisites:**")
+                        write_line("**Prerequisites:**")
                         for prereq in info["prerequisites"]:
-                            md_content.append(f"- {prereq}")
-                        md_content.append("")
+                            write_line(f"- {prereq}")
+                        write_line("")
 
-                    md_content.append(f"**Run:** `{info['run_command']}`")
-                    md_content.append("")
-                    md_content.append(f"**Cleanup:** {info['cleanup']}")
-                    md_content.append("")
+                    write_line(f"**Run:** `{info['run_command']}`")
+                    write_line("")
+                    write_line(f"**Cleanup:** {info['cleanup']}")
+                    write_line("")
 
                     if info["authors"]:
-                        md_content.append("**Authors:**")
+                        write_line("**Authors:**")
                         for author in info["authors"]:
-                            md_content.append(f"- {author}")
-                        md_content.append("")
+                            write_line(f"- {author}")
+                        write_line("")
 
-                    md_content.append("---")
-                    md_content.append("")
+                    write_line("---")
+                    write_line("")
 
-        return "\n".join(md_content)
-
-    def generate_sphinx_doc(self, examples: dict[str, dict[str, list[Path]]]) -> str:
+    def generate_sphinx_doc(self, examples: ExampleFiles) -> str:
         """Generate Sphinx documentation."""
-        rst_content = []
+        out = io.StringIO()
+        self._write_sphinx_doc(examples, out)
+        return out.getvalue()
+
+    def _write_sphinx_doc(self, examples: ExampleFiles, out: TextIO) -> None:
+        """Write Sphinx documentation to ``out``."""
+        write_line = _line_writer(out)
 
         # Header
-        rst_content.append("AI Agent Platform Examples")
-        rst_content.append("=" * 50)
-        rst_content.append("")
-        rst_content.append("This documentation is auto-generated from example files.")
-        rst_content.append("")
+        write_line("AI Agent Platform Examples")
+        write_line("=" * 50)
+        write_line("")
+        write_line("This documentation is auto-generated from example files.")
+        write_line("")
 
         # Generate content for each category
-        for category in self.categories:
-            if category not in examples:
-                continue
-
-            rst_content.append(f"{category.replace('-', ' ').title()}")
-            rst_content.append("-" * len(category.replace("-", " ")))
-            rst_content.append("")
+        for category, entries in self._by_category(examples):
+            write_line(_pretty(category))
+            write_line("-" * len(category))
+            write_line("")
 
-            for interface in self.interfaces:
-                files = examples[category][interface]
-                if not files:
-                    continue
-
-                interface_name = "Python SDK" if interface == "sdk" else "CLI"
-                rst_content.append(f"{interface_name}")
-                rst_content.append("^" * len(interface_name))
-                rst_content.append("")
+            for interface, files in entries:
+                interface_name = _INTERFACE_NAMES[interface]
+                write_line(f"{interface_name}")
+                write_line("^" * len(interface_name))
+                write_line("")
 
                 for file_path in files:
-                    info = self.parse_example_header(file_path, interface)
-
-                    rst_content.append(f"{info['title']}")
-                    rst_content.append("~" * len(info["title"]))
-                    rst_content.append("")
-                    rst_content.append(f"**Goal:** {info['goal']}")
-                    rst_content.append("")
-                    rst_content.append(f"**Estimated time:** {info['time']}")
-                    rst_content.append("")
-                    rst_content.append(f"**Complexity:** {info['complexity']}")
-                    rst_content.append("")
+                    info = self._header(file_path, interface)
+
+                    write_line(f"{info['title']}")
+                    write_line("~" * len(info["title"]))
+                    write_line("")
+                    write_line(f"**Goal:** {info['goal']}")
+                    write_line("")
+                    write_line(f"**Estimated time:** {info['time']}")
+                    write_line("")
+                    write_line(f"**Complexity:** {info['complexity']}")
+                    write_line("")
 
                     if info["prerequisites"]:
-                        rst_content.append("**Prerequisites:**")
+                        write_line("**Prerequisites:**")
                         for prereq in info["prerequisites"]:
-                            rst_content.append(f"- {prereq}")
-                        rst_content.append("")
+                            write_line(f"- {prereq}")
+                        write_line("")
 
-                    rst_content.append(f"**Run:** ``{info['run_command']}``")
-                    rst_content.append("")
-                    rst_content.append(f"**Cleanup:** {info['cleanup']}")
-                    rst_content.append("")
+                    write_line(f"**Run:** ``{info['run_command']}``")
+                    write_line("")
+                    write_line(f"**Cleanup:** {info['cleanup']}")
+                    write_line("")
 
                     if info["authors"]:
-                        rst_content.append("**Authors:**")
+                        write_line("**Authors:**")
                         for author in info["authors"]:
-                            rst_content.append(f"- {author}")
-                        rst_content.append("")
-
-                    rst_content.append("")
+                            write_line(f"- {author}")
+                        write_line("")
 
-        return "\n".join(rst_content)
+                    write_line("")
 
-    def generate_docs(self, format_type: str = "markdown") -> None:
-        """Generate documentation in the specified format."""
-        # Discover examples
-        examples = {}
+    @functools.cached_property
+    def examples(self) -> ExampleFiles:
+        """Example files per category and interface, discovered once per generator."""
+        examples: ExampleFiles = {}
 
         for category in self.categories:
-            examples[category] = {"sdk": [], "cli": []}
             category_path = self.examples_root / category
 
             if not category_path.exists():
@@ -294,20 +451,33 @@ class ExampleDocGenerator:
             for interface in self.interfaces:
                 interface_path = category_path / interface
                 if interface_path.exists():
-                    if interface == "sdk":
-                        files = list(interface_path.glob("*.py"))
-                    else:  # cli
-                        files = list(interface_path.glob("*.md"))
+                    suffix = ".py" if interface == "sdk" else ".md"
+                    # scandir reuses directory entries instead of globbing
+                    with os.scandir(interface_path) as entries:
+                        files = [
+                            Path(entry.path)
+                            for entry in entries
+                            if entry.name.endswith(suffix)
+                            and entry.is_file(follow_symlinks=False)
+                        ]
+
+                    if files:
+                        files.sort(key=lambda x: x.name)
+                        examples[category, interface] = files
+
+        return examples
 
-                    files.sort(key=lambda x: x.name)
-                    examples[category][interface] = files
+    def generate_docs(self, format_type: str = "markdown") -> None:
+        """Generate documentation in the specified format."""
+        examples = self.examples
+        self.parse_all_headers(examples)
 
-        # Generate documentation
+        # Pick the generator for the requested format
         if format_type == "markdown":
-            content = self.generate_markdown_doc(examples)
+            generate_doc = self.generate_markdown_doc
             output_file = self.output_dir / "examples.md"
         elif format_type == "sphinx":
-            content = self.generate_sphinx_doc(examples)
+            generate_doc = self.generate_sphinx_doc
             output_file = self.output_dir / "examples.rst"
         else:
             raise ValueError(f"Unsupported format: {format_type}")
@@ -315,9 +485,10 @@ class ExampleDocGenerator:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write documentation
-        output_file.write_text(content, encoding="utf-8")
-        print(f"✅ Generated {format_type} documentation: {output_file}")
+        if _write_if_changed(output_file, generate_doc(examples)):
+            print(f"✅ Generated {format_type} documentation: {output_file}")
+        else:
+            print(f"≡ Unchanged {format_type} documentation: {output_file}")
 
         # Also generate a simple index
         index_content = """# Examples Index
@@ -335,22 +506,25 @@ This index was auto-generated from example files.
 """
 
         for category in self.categories:
-            if category in examples:
-                sdk_count = len(examples[category]["sdk"])
-                cli_count = len(examples[category]["cli"])
-                total = sdk_count + cli_count
-
-                if total > 0:
-                    index_content += f"- **{category.replace('-', ' ').title()}** ({total} examples)\n"
-                    if sdk_count > 0:
-                        index_content += f"  - {sdk_count} Python SDK examples\n"
-                    if cli_count > 0:
-                        index_content += f"  - {cli_count} CLI examples\n"
-                    index_content += "\n"
+            sdk_count = len(examples.get((category, "sdk"), ()))
+            cli_count = len(examples.get((category, "cli"), ()))
+            total = sdk_count + cli_count
+
+            if total > 0:
+                index_content += f"- **{_pretty(category)}** ({total} examples)\n"
+                if sdk_count > 0:
+                    index_content += f"  - {sdk_count} Python SDK examples\n"
+                if cli_count > 0:
+                    index_content += f"  - {cli_count} CLI examples\n"
+                index_content += "\n"
 
         index_file = self.output_dir / "examples_index.md"
-        index_file.write_text(index_content, encoding="utf-8")
-        print(f"✅ Generated examples index: {index_file}")
+        if _write_if_changed(index_file, index_content):
+            print(f"✅ Generated examples index: {index_file}")
+        else:
+            print(f"≡ Unchanged examples index: {index_file}")
+
+        self._save_header_cache()
 
 
 def main():
@@ -4,6 +4,7 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import copy
 from unittest.mock import Mock
 from uuid import uuid4
 
@@ -11,6 +12,78 @@ import pytest
 
 from glaip_sdk.client import Client
 
+# Sample payload templates, built once at import. Fixtures hand out copies
+# (deep copies where values are nested) so tests can mutate them freely.
+_SAMPLE_AGENT = {
+    "name": "test-agent",
+    "type": "config",
+    "framework": "langchain",
+    "version": "1.0",
+    "instruction": "Test instruction for the agent",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "metadata": {"test": "value"},
+    "status": "active",
+}
+
+_SAMPLE_TOOL = {
+    "name": "test-tool",
+    "framework": "langchain",
+    "script": "def test_function(): pass",
+    "description": "Test tool",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "status": "active",
+}
+
+_SAMPLE_MCP = {
+    "name": "test-mcp",
+    "type": "openai",
+    "transport": "http",
+    "config": {"api_key": "test-key"},
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "status": "connected",
+    "connection_status": "active",
+}
+
+_SAMPLE_BASE_RESOURCE = {
+    "name": "test-resource",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "metadata": {"test": "value"},
+}
+
+_SAMPLE_AGENT_CREATE = {
+    "name": "test-agent",
+    "instruction": "Test instruction for the agent",
+    "type": "config",
+    "framework": "langchain",
+    "version": "1.0",
+    "timeout": 300,
+}
+
+_SAMPLE_TOOL_CREATE = {
+    "name": "test-tool",
+    "framework": "langchain",
+    "description": "Test tool description",
+}
+
+_SAMPLE_MCP_CREATE = {
+    "name": "test-mcp",
+    "type": "openai",
+    "transport": "http",
+    "config": {"api_key": "test-key"},
+}
+
+_SAMPLE_LANGUAGE_MODEL = {
+    "provider": "openai",
+    "name": "gpt-4o-mini",
+    "capabilities": ["text-generation", "chat"],
+    "max_tokens": 4096,
+    "pricing": {"input": 0.00001, "output": 0.00003},
+}
+
 
 @pytest.fixture
 def mock_client():
@@ -27,104 +100,46 @@ def valid_uuid():
 @pytest.fixture
 def sample_agent_data(valid_uuid):
     """Sample agent data for testing."""
-    return {
-        "id": valid_uuid,
-        "name": "test-agent",
-        "type": "config",
-        "framework": "langchain",
-        "version": "1.0",
-        "instruction": "Test instruction for the agent",
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "metadata": {"test": "value"},
-        "status": "active",
-    }
+    return {"id": valid_uuid, **copy.deepcopy(_SAMPLE_AGENT)}
 
 
 @pytest.fixture
 def sample_tool_data(valid_uuid):
     """Sample tool data for testing."""
-    return {
-        "id": valid_uuid,
-        "name": "test-tool",
-        "framework": "langchain",
-        "script": "def test_function(): pass",
-        "description": "Test tool",
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "status": "active",
-    }
+    return {"id": valid_uuid, **_SAMPLE_TOOL}
 
 
 @pytest.fixture
 def sample_mcp_data(valid_uuid):
     """Sample MCP data for testing."""
-    return {
-        "id": valid_uuid,
-        "name": "test-mcp",
-        "type": "openai",
-        "transport": "http",
-        "config": {"api_key": "test-key"},
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "status": "connected",
-        "connection_status": "active",
-    }
+    return {"id": valid_uuid, **copy.deepcopy(_SAMPLE_MCP)}
 
 
 @pytest.fixture
 def sample_base_resource_data(valid_uuid):
     """Sample base resource data for testing."""
-    return {
-        "id": valid_uuid,
-        "name": "test-resource",
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "metadata": {"test": "value"},
-    }
+    return {"id": valid_uuid, **copy.deepcopy(_SAMPLE_BASE_RESOURCE)}
 
 
 @pytest.fixture
 def sample_agent_create_data():
     """Sample agent creation data for testing."""
-    return {
-        "name": "test-agent",
-        "instruction": "Test instruction for the agent",
-        "type": "config",
-        "framework": "langchain",
-        "version": "1.0",
-        "timeout": 300,
-    }
+    return dict(_SAMPLE_AGENT_CREATE)
 
 
 @pytest.fixture
 def sample_tool_create_data():
     """Sample tool creation data for testing."""
-    return {
-        "name": "test-tool",
-        "framework": "langchain",
-        "description": "Test tool description",
-    }
+    return dict(_SAMPLE_TOOL_CREATE)
 
 
 @pytest.fixture
 def sample_mcp_create_data():
     """Sample MCP creation data for testing."""
-    return {
-        "name": "test-mcp",
-        "type": "openai",
-        "transport": "http",
-        "config": {"api_key": "test-key"},
-    }
+    return copy.deepcopy(_SAMPLE_MCP_CREATE)
 
 
 @pytest.fixture
 def sample_language_model_data():
     """Sample language model data for testing."""
-    return {
-        "provider": "openai",
-        "name": "gpt-4o-mini",
-        "capabilities": ["text-generation", "chat"],
-        "max_tokens": 4096,
-        "pricing": {"input": 0.00001, "output": 0.00003},
-    }
+    return copy.deepcopy(_SAMPLE_LANGUAGE_MODEL)
@@ -9,6 +9,9 @@ import os
 import subprocess
 
 import pytest
+from click.testing import CliRunner
+
+from glaip_sdk.cli.main import main as cli_main
 
 
 @pytest.mark.integration
@@ -16,6 +19,11 @@ import pytest
 class TestCLIModelIntegration:
     """CLI language model integration tests for the AIP SDK."""
 
+    @classmethod
+    def setup_class(cls):
+        """Create one CLI runner shared by every test in the class."""
+        cls.runner = CliRunner()
+
     def setup_method(self):
         """Set up environment for CLI testing."""
         self.api_key = os.getenv("AIP_API_KEY")
@@ -25,21 +33,29 @@ class TestCLIModelIntegration:
             pytest.skip("AIP_API_KEY and AIP_API_URL environment variables required")
 
     def _run_cli_command(self, command_args, capture_output=True):
-        """Run a CLI command and return the result."""
+        """Run a CLI command in-process and return the result.
+
+        Commands go through click's CliRunner instead of a fresh
+        ``python -m glaip_sdk.cli.main`` per call, so interpreter start-up and
+        SDK imports are paid once for the whole class. Output is always
+        captured; ``capture_output`` is kept for call compatibility.
+        """
         full_command = [
-            "python",
-            "-m",
-            "glaip_sdk.cli.main",
             "--api-url",
             self.api_url,
             "--api-key",
             self.api_key,
         ] + command_args
 
-        result = subprocess.run(
-            full_command, capture_output=capture_output, text=True, check=False
+        result = self.runner.invoke(cli_main, full_command)
+        stderr = result.stderr
+        if result.exception is not None and not isinstance(
+            result.exception, SystemExit
+        ):
+            stderr += f"{type(result.exception).__name__}: {result.exception}"
+        return subprocess.CompletedProcess(
+            full_command, result.exit_code, stdout=result.stdout, stderr=stderr
         )
-        return result
 
     def test_cli_models_list(self):
         """Test CLI language model listing."""
@@ -204,9 +220,9 @@ class TestCLIModelIntegration:
         """Test CLI models verbose output functionality."""
         # Since --verbose option doesn't exist, test basic list functionality
         verbose_result = self._run_cli_command(["models", "list"])
-        assert (
-            verbose_result.returncode == 0
-        ), f"CLI command failed: {verbose_result.stderr}"
+        assert verbose_result.returncode == 0, (
+            f"CLI command failed: {verbose_result.stderr}"
+        )
         # The list command should show basic model information
         assert (
             "models" in verbose_result.stdout.lower()
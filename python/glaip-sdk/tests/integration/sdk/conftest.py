@@ -0,0 +1,39 @@
+"""Shared fixtures for the SDK integration tests.
+
+Authors:
+    Raymond Christopher (raymond.christopher@gdplabs.id)
+"""
+
+import os
+
+import pytest
+
+from glaip_sdk import Client
+
+# Keep-alive connections held by the shared client between tests
+SESSION_POOL_SIZE = 20
+
+
+@pytest.fixture(scope="session")
+def aip_client():
+    """Create one SDK client shared by every integration test in the session.
+
+    Reusing the client keeps its connection pool warm, so tests do not pay a
+    new TCP/TLS handshake each. The pool is sized for the whole suite, and the
+    client is closed when the session ends.
+    """
+    api_key = os.getenv("AIP_API_KEY")
+    api_url = os.getenv("AIP_API_URL")
+
+    if not api_key or not api_url:
+        pytest.skip("AIP_API_KEY and AIP_API_URL environment variables required")
+
+    client = Client(api_url=api_url, api_key=api_key, pool_size=SESSION_POOL_SIZE)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def all_tools(aip_client):
+    """List the backend's tools once for every test that only reads them."""
+    return aip_client.list_tools()
@@ -5,28 +5,20 @@ These tests verify agent lifecycle operations and interactions.
 Run with: pytest tests/integration/test_agent_integration.py -m integration
 """
 
-import os
 import uuid
 
 import pytest
 
-from glaip_sdk import Client
-
 
 @pytest.mark.integration
 @pytest.mark.sdk
 class TestAgentIntegration:
     """Agent integration tests for the AIP SDK."""
 
-    def setup_method(self):
-        """Set up the SDK client for testing."""
-        api_key = os.getenv("AIP_API_KEY")
-        api_url = os.getenv("AIP_API_URL")
-
-        if not api_key or not api_url:
-            pytest.skip("AIP_API_KEY and AIP_API_URL environment variables required")
-
-        self.client = Client(api_url=api_url, api_key=api_key)
+    @pytest.fixture(autouse=True)
+    def _setup(self, aip_client):
+        """Set up the shared SDK client for testing."""
+        self.client = aip_client
         self.test_agent_name = f"test-sdk-agent-{uuid.uuid4().hex[:8]}"
         self.created_agents = []  # Track created agents for cleanup
 
@@ -152,7 +144,7 @@ class TestAgentIntegration:
             # Run the agent multiple times to test concurrency
             results = []
             for i in range(3):
-                result = agent.run(f"Say hello {i+1}")
+                result = agent.run(f"Say hello {i + 1}")
                 results.append(result)
                 assert result is not None
                 assert len(str(result)) > 0
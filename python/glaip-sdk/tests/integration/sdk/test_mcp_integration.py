@@ -5,12 +5,65 @@ These tests verify MCP (Model Context Protocol) operations and interactions.
 Run with: pytest tests/integration/test_mcp_integration.py -m integration
 """
 
-import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from glaip_sdk import Client
+from glaip_sdk.exceptions import NotFoundError
+
+# MCPs that tests only read, created together once per class
+SHARED_MCP_SUFFIXES = (
+    "get-by-id",
+    "get-by-name",
+    "tools-test",
+    "resource-methods",
+    "connection-status",
+    "configuration",
+)
+
+
+def _create_mcp(client, name, name_suffix):
+    """Create a test MCP, returning None if the backend refuses it."""
+    try:
+        # Create MCP using a public test MCP URL (similar to backend integration tests)
+        return client.create_mcp(
+            name=name,
+            transport="sse",  # Transport protocol (not "type")
+            description=f"Test MCP for SDK integration testing - {name_suffix}",
+            config={
+                "url": "https://mcp.obrol.id/f/sse",  # Public test MCP endpoint
+            },
+        )
+    except Exception as e:
+        print(f"Failed to create test MCP: {e}")
+        return None
+
+
+@pytest.fixture(scope="class")
+def shared_mcps(aip_client):
+    """Create the read-only test MCPs concurrently and delete them afterwards.
+
+    Creating them in parallel costs about one round trip instead of one per
+    test. Every test using this fixture is in the "shared-mcps" xdist group,
+    so the MCPs are created once, on one worker. Values are None for MCPs the
+    backend refused to create.
+    """
+    base_name = f"test-sdk-mcp-{uuid.uuid4().hex[:8]}"
+    with ThreadPoolExecutor(max_workers=len(SHARED_MCP_SUFFIXES)) as executor:
+        mcps = list(
+            executor.map(
+                lambda suffix: _create_mcp(aip_client, f"{base_name}-{suffix}", suffix),
+                SHARED_MCP_SUFFIXES,
+            )
+        )
+    yield dict(zip(SHARED_MCP_SUFFIXES, mcps, strict=True))
+    try:
+        aip_client.delete_many(
+            [("mcp", mcp.id) for mcp in mcps if mcp], missing_ok=True
+        )
+    except Exception as e:
+        print(f"Failed to clean up shared MCPs: {e}")
 
 
 @pytest.mark.integration
@@ -18,37 +71,22 @@ from glaip_sdk import Client
 class TestMCPIntegration:
     """MCP integration tests for the AIP SDK."""
 
-    def setup_method(self):
-        """Set up the SDK client for testing."""
-        api_key = os.getenv("AIP_API_KEY")
-        api_url = os.getenv("AIP_API_URL")
-
-        if not api_key or not api_url:
-            pytest.skip("AIP_API_KEY and AIP_API_URL environment variables required")
-
-        self.client = Client(api_url=api_url, api_key=api_key)
+    @pytest.fixture(autouse=True)
+    def _setup(self, aip_client):
+        """Set up the shared SDK client for testing and clean up afterwards."""
+        self.client = aip_client
         self.test_mcp_name = f"test-sdk-mcp-{uuid.uuid4().hex[:8]}"
         self.created_mcps = []  # Track created MCPs for cleanup
+        yield
+        self._cleanup_mcps()
 
     def _create_test_mcp(self, name_suffix="basic"):
         """Create a test MCP for integration testing."""
         test_name = f"{self.test_mcp_name}-{name_suffix}"
-
-        try:
-            # Create MCP using a public test MCP URL (similar to backend integration tests)
-            mcp = self.client.create_mcp(
-                name=test_name,
-                transport="sse",  # Transport protocol (not "type")
-                description=f"Test MCP for SDK integration testing - {name_suffix}",
-                config={
-                    "url": "https://mcp.obrol.id/f/sse",  # Public test MCP endpoint
-                },
-            )
+        mcp = _create_mcp(self.client, test_name, name_suffix)
+        if mcp:
             self.created_mcps.append(mcp.id)
-            return mcp
-        except Exception as e:
-            print(f"Failed to create test MCP: {e}")
-            return None
+        return mcp
 
     def _cleanup_mcps(self):
         """Clean up created MCPs."""
@@ -59,10 +97,6 @@ class TestMCPIntegration:
                 print(f"Failed to clean up MCP {mcp_id}: {e}")
         self.created_mcps.clear()
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        self._cleanup_mcps()
-
     def test_list_mcps(self):
         """Test listing MCPs."""
         mcps = self.client.list_mcps()
@@ -74,10 +108,11 @@ class TestMCPIntegration:
             assert hasattr(mcp, "name")
             assert hasattr(mcp, "transport")
 
-    def test_get_mcp_by_id(self):
+    @pytest.mark.xdist_group("shared-mcps")
+    def test_get_mcp_by_id(self, shared_mcps):
         """Test getting MCP by ID."""
-        # Create a test MCP
-        test_mcp = self._create_test_mcp("get-by-id")
+        # Use the shared test MCP
+        test_mcp = shared_mcps["get-by-id"]
         if not test_mcp:
             pytest.skip("Could not create test MCP")
 
@@ -87,10 +122,11 @@ class TestMCPIntegration:
         assert retrieved_mcp.name == test_mcp.name
         assert retrieved_mcp.transport == test_mcp.transport
 
-    def test_get_mcp_by_name(self):
+    @pytest.mark.xdist_group("shared-mcps")
+    def test_get_mcp_by_name(self, shared_mcps):
         """Test getting MCP by name."""
-        # Create a test MCP
-        test_mcp = self._create_test_mcp("get-by-name")
+        # Use the shared test MCP
+        test_mcp = shared_mcps["get-by-name"]
         if not test_mcp:
             pytest.skip("Could not create test MCP")
 
@@ -113,10 +149,11 @@ class TestMCPIntegration:
             assert hasattr(mcp, "name")
             assert hasattr(mcp, "transport")
 
-    def test_get_mcp_tools(self):
+    @pytest.mark.xdist_group("shared-mcps")
+    def test_get_mcp_tools(self, shared_mcps):
         """Test getting tools from MCP."""
-        # Create a test MCP
-        test_mcp = self._create_test_mcp("tools-test")
+        # Use the shared test MCP
+        test_mcp = shared_mcps["tools-test"]
         if not test_mcp:
             pytest.skip("Could not create test MCP")
 
@@ -132,10 +169,11 @@ class TestMCPIntegration:
             else:
                 assert hasattr(tool, "name")
 
-    def test_mcp_resource_methods(self):
+    @pytest.mark.xdist_group("shared-mcps")
+    def test_mcp_resource_methods(self, shared_mcps):
         """Test MCP resource object methods."""
-        # Create a test MCP
-        test_mcp = self._create_test_mcp("resource-methods")
+        # Use the shared test MCP
+        test_mcp = shared_mcps["resource-methods"]
         if not test_mcp:
             pytest.skip("Could not create test MCP")
 
@@ -153,17 +191,16 @@ class TestMCPIntegration:
 
     def test_mcp_error_handling(self):
         """Test MCP error handling for invalid requests."""
+        # A well-formed ID that does not exist, so the backend answers 404
+        missing_id = str(uuid.uuid4())
+
         # Test getting non-existent MCP
-        with pytest.raises(Exception):
-            self.client.get_mcp("non-existent-id")
+        with pytest.raises(NotFoundError):
+            self.client.get_mcp(missing_id)
 
         # Test getting MCP tools for non-existent MCP
-        with pytest.raises(Exception):
-            # Create a dummy MCP object to test the method
-            dummy_mcp = type(
-                "DummyMCP", (), {"id": "non-existent-id", "_client": self.client}
-            )()
-            dummy_mcp.get_tools()
+        with pytest.raises(NotFoundError):
+            self.client.mcps.get_mcp_tools(missing_id)
 
     def test_mcp_search_functionality(self):
         """Test MCP search functionality."""
@@ -182,10 +219,11 @@ class TestMCPIntegration:
             mcp_names = [m.name for m in found_mcps]
             assert all_mcps[0].name in mcp_names
 
-    def test_mcp_connection_status(self):
+    @pytest.mark.xdist_group("shared-mcps")
+    def test_mcp_connection_status(self, shared_mcps):
         """Test MCP connection status."""
-        # Create a test MCP
-        test_mcp = self._create_test_mcp("connection-status")
+        # Use the shared test MCP
+        test_mcp = shared_mcps["connection-status"]
         if not test_mcp:
             pytest.skip("Could not create test MCP")
 
@@ -202,10 +240,11 @@ class TestMCPIntegration:
         if hasattr(test_mcp, "status"):
             assert test_mcp.status in ["active", "inactive", "error", None]
 
-    def test_mcp_configuration(self):
+    @pytest.mark.xdist_group("shared-mcps")
+    def test_mcp_configuration(self, shared_mcps):
         """Test MCP configuration handling."""
-        # Create a test MCP
-        test_mcp = self._create_test_mcp("configuration")
+        # Use the shared test MCP
+        test_mcp = shared_mcps["configuration"]
         if not test_mcp:
             pytest.skip("Could not create test MCP")
 
@@ -218,6 +257,7 @@ class TestMCPIntegration:
             # Our test MCP should have a URL in config
             assert "url" in test_mcp.config
 
+    @pytest.mark.xdist_group("mutating")
     def test_mcp_create_and_delete_lifecycle(self):
         """Test complete MCP lifecycle: create, verify, delete."""
         # Create a test MCP
@@ -236,7 +276,7 @@ class TestMCPIntegration:
         retrieved_mcp = self.client.get_mcp(test_mcp.id)
         assert retrieved_mcp.id == test_mcp.id
 
-        # Test deletion (will be done by teardown, but test explicit delete)
+        # Test deletion (will be done by the fixture, but test explicit delete)
         mcp_id = test_mcp.id
         self.client.delete_mcp(mcp_id)
 
@@ -245,7 +285,7 @@ class TestMCPIntegration:
             self.created_mcps.remove(mcp_id)
 
         # Verify it's deleted
-        with pytest.raises(Exception):
+        with pytest.raises(NotFoundError):
             self.client.get_mcp(mcp_id)
 
 
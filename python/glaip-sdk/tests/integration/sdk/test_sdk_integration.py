@@ -5,12 +5,11 @@ These tests require a running backend and test actual API interactions.
 Run with: pytest tests/integration/ -m integration
 """
 
-import os
 import uuid
 
 import pytest
 
-from glaip_sdk import Client
+from glaip_sdk.exceptions import NotFoundError
 
 
 @pytest.mark.integration
@@ -18,28 +17,13 @@ from glaip_sdk import Client
 class TestSDKIntegration:
     """Integration tests for the AIP SDK."""
 
-    def setup_method(self):
-        """Set up the SDK client for testing."""
-        api_key = os.getenv("AIP_API_KEY")
-        api_url = os.getenv("AIP_API_URL")
-
-        if not api_key or not api_url:
-            pytest.skip("AIP_API_KEY and AIP_API_URL environment variables required")
-
-        self.client = Client(api_url=api_url, api_key=api_key)
+    @pytest.fixture(autouse=True)
+    def _setup(self, aip_client):
+        """Set up the shared SDK client for testing."""
+        self.client = aip_client
         self.test_agent_name = f"test-sdk-agent-{uuid.uuid4().hex[:8]}"
 
-    def test_list_agents(self):
-        """Test listing agents."""
-        agents = self.client.list_agents()
-        assert isinstance(agents, list)
-        assert len(agents) > 0
-
-        # Check that agents have required fields
-        for agent in agents:
-            assert hasattr(agent, "id")
-            assert hasattr(agent, "name")
-
+    @pytest.mark.xdist_group("mutating")
     def test_create_and_delete_agent(self):
         """Test creating and deleting an agent."""
         # Create agent
@@ -60,9 +44,10 @@ class TestSDKIntegration:
         self.client.delete_agent(agent.id)
 
         # Verify agent is deleted
-        with pytest.raises(Exception):  # Should raise 404 or similar
+        with pytest.raises(NotFoundError):
             self.client.get_agent(agent.id)
 
+    @pytest.mark.xdist_group("mutating")
     def test_agent_lifecycle(self):
         """Test complete agent lifecycle."""
         # Create
@@ -80,44 +65,14 @@ class TestSDKIntegration:
         # Clean up
         self.client.delete_agent(agent.id)
 
-    def test_list_tools(self):
-        """Test listing tools."""
-        tools = self.client.list_tools()
-        assert isinstance(tools, list)
-
-        # Check that tools have required fields
-        for tool in tools:
-            assert hasattr(tool, "id")
-            assert hasattr(tool, "name")
-
-    def test_list_mcps(self):
-        """Test listing MCPs."""
-        mcps = self.client.list_mcps()
-        assert isinstance(mcps, list)
-
-        # Check that MCPs have required fields
-        for mcp in mcps:
-            assert hasattr(mcp, "id")
-            assert hasattr(mcp, "name")
-
-    def test_list_language_models(self):
-        """Test listing language models."""
-        models = self.client.list_language_models()
-        assert isinstance(models, list)
-
-        # Check that models have required fields
-        for model in models:
-            assert "provider" in model
-            assert "name" in model
-
     def test_error_handling(self):
         """Test error handling for invalid requests."""
         # Test getting non-existent agent
-        with pytest.raises(Exception):
-            self.client.get_agent("non-existent-id")
+        with pytest.raises(NotFoundError):
+            self.client.get_agent(str(uuid.uuid4()))
 
-        # Test creating agent with invalid data
-        with pytest.raises(Exception):
+        # Test creating agent with invalid data; rejected before any request
+        with pytest.raises(ValueError):
             self.client.create_agent(
                 name="",  # Empty name should fail
                 instruction="Test",
@@ -8,19 +8,29 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import contextlib
+import functools
+import logging
 import os
+import sys
 import tempfile
 import uuid
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from uuid import uuid4
 
 import pytest
 
 from glaip_sdk import Client
-from glaip_sdk.exceptions import AIPError, NotFoundError
+from glaip_sdk.exceptions import AIPError, NotFoundError, ValidationError
 from glaip_sdk.models import Agent
 
+_log = logging.getLogger(__name__)
+
 
 # Environment Configuration
 def get_test_environment() -> tuple[str, str]:
@@ -92,6 +102,11 @@ def generate_test_instruction(agent_type: str = "general") -> str:
     return base_instruction.get(agent_type, base_instruction["general"])
 
 
+# Defaults shared by the resource creation helpers
+_DEFAULT_MCP_CONFIG = MappingProxyType({"url": "https://mcp.obrol.id/f/sse"})
+_DEFAULT_SIMPLE_INSTRUCTION = generate_test_instruction("simple")
+
+
 def create_test_tool_file(content: str = None, filename: str = None) -> str:
     """Create a temporary test tool file.
 
@@ -123,6 +138,39 @@ def test_tool(input_text: str = "Hello") -> str:
 
 
 # Resource Management
+def _delete_resource(delete, resource_id: str) -> None:
+    """Delete a resource, treating an already-deleted resource as success."""
+    with contextlib.suppress(NotFoundError):
+        delete(resource_id)
+
+
+def _delete_concurrently(deletions: list[tuple[str, Callable, str]]) -> None:
+    """Run ``(resource_type, delete, resource_id)`` deletions in a thread pool.
+
+    Failures are logged rather than raised, so one failed deletion does not
+    stop the others.
+    """
+    with ThreadPoolExecutor(max_workers=min(32, len(deletions))) as executor:
+        futures = [
+            (
+                resource_type,
+                resource_id,
+                executor.submit(_delete_resource, delete, resource_id),
+            )
+            for resource_type, delete, resource_id in deletions
+        ]
+
+    for resource_type, resource_id, future in futures:
+        error = future.exception()
+        if error is not None:
+            _log.warning(
+                "Failed to clean up %s %s: %s",
+                resource_type,
+                resource_id,
+                error,
+            )
+
+
 class ResourceManager:
     """Manages test resources for automatic cleanup."""
 
@@ -171,34 +219,29 @@ class ResourceManager:
         self.temp_files.append(file_path)
 
     def cleanup(self) -> None:
-        """Clean up all tracked resources."""
-        # Clean up agents
-        for agent_id in self.agents:
-            try:
-                self.client.delete_agent(agent_id)
-            except Exception as e:
-                print(f"Warning: Failed to clean up agent {agent_id}: {e}")
+        """Clean up all tracked resources.
 
-        # Clean up tools
-        for tool_id in self.tools:
-            try:
-                self.client.delete_tool(tool_id)
-            except Exception as e:
-                print(f"Warning: Failed to clean up tool {tool_id}: {e}")
+        Agents are deleted first, so no tool or MCP is deleted while an agent
+        still references it; tools and MCPs then go in a second wave. Each wave
+        runs its deletions concurrently.
+        """
+        agent_deletions = [
+            ("agent", self.client.delete_agent, agent_id) for agent_id in self.agents
+        ]
+        other_deletions = [
+            ("tool", self.client.delete_tool, tool_id) for tool_id in self.tools
+        ] + [("MCP", self.client.delete_mcp, mcp_id) for mcp_id in self.mcps]
 
-        # Clean up MCPs
-        for mcp_id in self.mcps:
-            try:
-                self.client.delete_mcp(mcp_id)
-            except Exception as e:
-                print(f"Warning: Failed to clean up MCP {mcp_id}: {e}")
+        for deletions in (agent_deletions, other_deletions):
+            if deletions:
+                _delete_concurrently(deletions)
 
         # Clean up temporary files
         for file_path in self.temp_files:
             try:
                 Path(file_path).unlink(missing_ok=True)
-            except Exception as e:
-                print(f"Warning: Failed to clean up temp file {file_path}: {e}")
+            except OSError as e:
+                _log.warning("Failed to clean up temp file %s: %s", file_path, e)
 
         # Clear lists
         self.agents.clear()
@@ -235,7 +278,7 @@ def create_test_agent(
         name = f"test-agent-{uuid4().hex[:8]}"
 
     if instruction is None:
-        instruction = generate_test_instruction("simple")
+        instruction = _DEFAULT_SIMPLE_INSTRUCTION
 
     # Create resource manager for cleanup
     resource_manager = ResourceManager(client)
@@ -329,7 +372,8 @@ def create_test_mcp(
         description = "Test MCP for integration testing"
 
     if config is None:
-        config = {"url": "https://mcp.obrol.id/f/sse"}
+        # Copy the read-only default so the request payload stays JSON-serializable
+        config = dict(_DEFAULT_MCP_CONFIG)
 
     # Create resource manager for cleanup
     resource_manager = ResourceManager(client)
@@ -419,8 +463,6 @@ def assert_raises_validation_error(func, *args, **kwargs):
         *args: Function arguments
         **kwargs: Function keyword arguments
     """
-    from glaip_sdk.exceptions import ValidationError
-
     with pytest.raises(ValidationError):
         func(*args, **kwargs)
 
@@ -438,36 +480,58 @@ def assert_raises_aip_error(func, *args, **kwargs):
 
 
 # Test Data Utilities
+@dataclass(slots=True, frozen=True)
+class _ChatMessage:
+    """A single chat history entry."""
+
+    role: str
+    content: str
+
+
+@functools.lru_cache(maxsize=64)
+def _payload_without_history(input_text: str) -> Mapping[str, Any]:
+    """Build a cached, read-only payload that has no chat history."""
+    return MappingProxyType({"input": input_text})
+
+
 def create_test_payload(
-    input_text: str = "Hello", chat_history: list[dict[str, str]] = None
-) -> dict[str, Any]:
+    input_text: str = "Hello", chat_history: list[_ChatMessage] = None
+) -> Mapping[str, Any]:
     """Create a test payload for agent execution.
 
+    Payloads without chat history are cached and returned as read-only
+    mappings; callers that need to modify the payload must copy it first
+    (e.g. ``dict(payload)``).
+
     Args:
         input_text: Input text for the agent
-        chat_history: Optional chat history
+        chat_history: Optional chat history from create_test_chat_history
 
     Returns:
-        Test payload dictionary
+        Test payload mapping
     """
-    payload = {"input": input_text}
+    if not chat_history:
+        return _payload_without_history(input_text)
 
-    if chat_history:
-        payload["chat_history"] = chat_history
-
-    return payload
+    return {
+        "input": input_text,
+        "chat_history": [
+            {"role": message.role, "content": message.content}
+            for message in chat_history
+        ],
+    }
 
 
 def create_test_chat_history(
     messages: list[tuple[str, str]] = None,
-) -> list[dict[str, str]]:
+) -> list[_ChatMessage]:
     """Create test chat history.
 
     Args:
         messages: List of (role, content) tuples
 
     Returns:
-        Chat history list
+        Chat history list, serialized to dicts by create_test_payload
     """
     if messages is None:
         messages = [
@@ -476,7 +540,7 @@ def create_test_chat_history(
             ("user", "What's the weather like?"),
         ]
 
-    return [{"role": role, "content": content} for role, content in messages]
+    return [_ChatMessage(role, content) for role, content in messages]
 
 
 # File Handling Helpers
@@ -504,8 +568,8 @@ def cleanup_temp_file(file_path: str) -> None:
     """
     try:
         Path(file_path).unlink(missing_ok=True)
-    except Exception as e:
-        print(f"Warning: Failed to clean up temp file {file_path}: {e}")
+    except OSError as e:
+        _log.warning("Failed to clean up temp file %s: %s", file_path, e)
 
 
 # Context Manager for Resource Management
@@ -617,7 +681,7 @@ def get_test_config() -> dict[str, Any]:
         "default_model": "gpt-4o-mini",
         "default_timeout": 300,
         "default_framework": "langchain",
-        "test_mcp_url": "https://mcp.obrol.id/f/sse",
+        "test_mcp_url": _DEFAULT_MCP_CONFIG["url"],
         "max_retries": 3,
         "retry_delay": 1.0,
     }
@@ -663,25 +727,39 @@ def log_test_step(step_name: str) -> None:
     print(f"\n{'='*20} {step_name} {'='*20}")
 
 
+_CREATE_PREFIX = "✅ Created"
+_CLEANUP_PREFIX = "🧹 Cleaned up"
+
+
 def log_resource_creation(
     resource_type: str, resource_id: str, resource_name: str = None
 ) -> None:
     """Log resource creation for debugging.
 
+    Only writes output when AIP_TEST_VERBOSE is set.
+
     Args:
         resource_type: Type of resource (agent, tool, mcp)
         resource_id: Resource ID
         resource_name: Resource name (optional)
     """
+    if not os.environ.get("AIP_TEST_VERBOSE"):
+        return
+
     name_info = f" ({resource_name})" if resource_name else ""
-    print(f"✅ Created {resource_type}: {resource_id}{name_info}")
+    sys.stdout.write(f"{_CREATE_PREFIX} {resource_type}: {resource_id}{name_info}\n")
 
 
 def log_resource_cleanup(resource_type: str, resource_id: str) -> None:
     """Log resource cleanup for debugging.
 
+    Only writes output when AIP_TEST_VERBOSE is set.
+
     Args:
         resource_type: Type of resource (agent, tool, mcp)
         resource_id: Resource ID
     """
-    print(f"🧹 Cleaned up {resource_type}: {resource_id}")
+    if not os.environ.get("AIP_TEST_VERBOSE"):
+        return
+
+    sys.stdout.write(f"{_CLEANUP_PREFIX} {resource_type}: {resource_id}\n")
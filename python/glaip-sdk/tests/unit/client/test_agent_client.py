@@ -4,12 +4,13 @@
 Tests the AgentClient class functionality without external dependencies.
 """
 
+import threading
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
 import pytest
 
-from glaip_sdk.client.agents import AgentClient
+from glaip_sdk.client.agents import AgentClient, _select_renderer
 
 
 @pytest.mark.unit
@@ -395,6 +396,7 @@ class TestAgentClient:
             assert result is None  # delete_agent returns None
             mock_request.assert_called_once_with("DELETE", f"/agents/{agent_id}")
 
+    @patch("glaip_sdk.client.base.ORJSON_AVAILABLE", False)
     def test_run_agent_with_kwargs(self):
         """Test running agent with additional parameters."""
         agent_id = str(uuid4())
@@ -467,6 +469,117 @@ class TestAgentClient:
 
                 assert isinstance(output, str)  # Should return a string (may be empty)
 
+    def test_run_batch_preserves_order(self):
+        """Test running a batch of messages returns results in input order."""
+        agent_id = str(uuid4())
+
+        with patch.object(self.client, "run_agent") as mock_run_agent:
+            mock_run_agent.side_effect = lambda _agent_id, message, **_: message.upper()
+
+            results = list(
+                self.client.run_batch(
+                    agent_id, ["one", "two", "three"], session_id="session-1"
+                )
+            )
+
+            assert results == ["ONE", "TWO", "THREE"]
+            assert mock_run_agent.call_count == 3
+            for call in mock_run_agent.call_args_list:
+                assert call[0][0] == agent_id
+                assert call[1]["session_id"] == "session-1"
+                assert call[1]["renderer"] == "silent"
+
+    def test_run_batch_empty(self):
+        """Test running an empty batch makes no requests."""
+        with patch.object(self.client, "run_agent") as mock_run_agent:
+            assert list(self.client.run_batch(str(uuid4()), [])) == []
+            mock_run_agent.assert_not_called()
+
+    def test_start_and_collect_agent_run(self):
+        """Test a background run returns a task ID and is collected once."""
+        agent_id = str(uuid4())
+
+        with patch.object(self.client, "run_agent", return_value="done") as mock_run:
+            task_id = self.client.start_agent_run(agent_id, "hello", session_id="s")
+
+            assert self.client.collect_agent_run(task_id, timeout=5) == "done"
+            mock_run.assert_called_once_with(
+                agent_id, "hello", session_id="s", renderer="silent"
+            )
+            with pytest.raises(KeyError):
+                self.client.collect_agent_run(task_id)
+
+    def test_collect_agent_run_forgets_failed_run(self):
+        """Test a run that raised is removed once its error is collected."""
+        with patch.object(
+            self.client, "run_agent", side_effect=RuntimeError("run failed")
+        ):
+            task_id = self.client.start_agent_run(str(uuid4()), "hello")
+
+            with pytest.raises(RuntimeError, match="run failed"):
+                self.client.collect_agent_run(task_id, timeout=5)
+            assert task_id not in self.client._background_runs
+
+    def test_collect_agent_run_timeout_keeps_run(self):
+        """Test a run still going after a timeout can be collected again."""
+        release = threading.Event()
+
+        def slow_run(*_args, **_kwargs):
+            release.wait(5)
+            return "late"
+
+        with patch.object(self.client, "run_agent", side_effect=slow_run):
+            task_id = self.client.start_agent_run(str(uuid4()), "hello")
+
+            with pytest.raises(TimeoutError):
+                self.client.collect_agent_run(task_id, timeout=0.01)
+            release.set()
+            assert self.client.collect_agent_run(task_id, timeout=5) == "late"
+
+    def test_close_waits_for_background_runs(self):
+        """Test close shuts the background executor down after its runs."""
+        with patch.object(self.client, "run_agent", return_value="done"):
+            self.client.start_agent_run(str(uuid4()), "hello")
+            executor = self.client._background_executor
+
+            self.client.close()
+
+            assert executor._shutdown is True
+            assert self.client._background_executor is None
+
+    def test_stream_agent_yields_content_and_stops_early(self):
+        """Test streaming yields content events and closes the stream on early exit."""
+        agent_id = str(uuid4())
+
+        mock_stream_response = Mock()
+        mock_stream_response.__enter__ = Mock(return_value=mock_stream_response)
+        mock_stream_response.__exit__ = Mock(return_value=None)
+        mock_stream_response.iter_lines.return_value = [
+            'data: {"content": "Artifact received: x"}',
+            "",
+            'data: {"content": "first"}',
+            "",
+            'data: {"content": "second"}',
+            "",
+        ]
+
+        with patch.object(self.client, "http_client") as mock_http_client:
+            mock_http_client.stream.return_value = mock_stream_response
+
+            chunks = self.client.stream_agent(agent_id, "Hello", session_id="s")
+            assert next(chunks) == "first"
+            chunks.close()
+
+            mock_stream_response.__exit__.assert_called_once()
+            call_args = mock_http_client.stream.call_args
+            assert call_args[0][1] == f"/agents/{agent_id}/run"
+            assert call_args[1]["headers"]["Accept"] == "text/event-stream"
+
+    def test_select_renderer_silent(self):
+        """Test the silent renderer discards console output."""
+        renderer = _select_renderer("silent")
+        assert renderer.console.quiet is True
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-m", "unit"])
@@ -10,7 +10,12 @@ from unittest.mock import Mock, patch
 import httpx
 import pytest
 
-from glaip_sdk.client.base import BaseClient
+from glaip_sdk.client.base import (
+    KEEPALIVE_EXPIRY,
+    BaseClient,
+    _encode_json_body,
+    _load_dotenv_once,
+)
 from glaip_sdk.exceptions import (
     AuthenticationError,
     ConflictError,
@@ -25,6 +30,10 @@ from glaip_sdk.exceptions import (
 class TestBaseClient:
     """Test the base client functionality."""
 
+    def setup_method(self):
+        """Reset the once-per-process .env loading between tests."""
+        _load_dotenv_once.cache_clear()
+
     @patch.dict(os.environ, {}, clear=True)
     @patch("glaip_sdk.client.base.load_dotenv")
     def test_base_client_initialization(self, mock_load_dotenv):
@@ -35,6 +44,14 @@ class TestBaseClient:
         assert client._timeout == 60.0
         mock_load_dotenv.assert_called_once()
 
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_base_client_loads_dotenv_once(self, mock_load_dotenv):
+        """Test .env is only loaded by the first client in a process."""
+        BaseClient(api_url="http://test.com", api_key="test-key")
+        BaseClient(api_url="http://test.com", api_key="test-key")
+        mock_load_dotenv.assert_called_once()
+
     @patch.dict(os.environ, {}, clear=True)
     @patch("glaip_sdk.client.base.load_dotenv")
     def test_base_client_request_retry_logic(self, mock_load_dotenv):
@@ -213,6 +230,23 @@ class TestBaseClient:
         assert hasattr(client.http_client, "timeout")
         assert client.http_client.timeout.connect == 30.0
 
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_base_client_pool_size(self, mock_load_dotenv):
+        """Test base client pool size configures keep-alive limits."""
+        with patch("glaip_sdk.client.base.httpx.Limits", wraps=httpx.Limits) as limits:
+            parent = BaseClient(
+                api_url="http://test.com", api_key="test-key", pool_size=4
+            )
+
+        limits.assert_called_once_with(
+            max_keepalive_connections=4,
+            max_connections=100,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        child = BaseClient(parent_client=parent)
+        assert child._pool_size == 4
+
     @patch.dict(os.environ, {}, clear=True)
     @patch("glaip_sdk.client.base.load_dotenv")
     def test_base_client_user_agent(self, mock_load_dotenv):
@@ -222,3 +256,37 @@ class TestBaseClient:
         # Check that user agent is set
         assert "User-Agent" in client.http_client.headers
         assert "glaip-sdk" in client.http_client.headers["User-Agent"]
+
+    def test_encode_json_body_without_orjson(self):
+        """Test json bodies are left to httpx when orjson is unavailable."""
+        request_kwargs = {"json": {"a": 1}}
+        with patch("glaip_sdk.client.base.ORJSON_AVAILABLE", False):
+            assert _encode_json_body(request_kwargs) is request_kwargs
+
+    def test_encode_json_body_with_orjson(self):
+        """Test json bodies are pre-encoded when orjson is available."""
+        mock_orjson = Mock()
+        mock_orjson.dumps.return_value = b'{"a":1}'
+        with (
+            patch("glaip_sdk.client.base.ORJSON_AVAILABLE", True),
+            patch("glaip_sdk.client.base.orjson", mock_orjson, create=True),
+        ):
+            encoded = _encode_json_body({"json": {"a": 1}, "headers": {"X": "y"}})
+
+        assert encoded == {
+            "content": b'{"a":1}',
+            "headers": {"Content-Type": "application/json", "X": "y"},
+        }
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_base_client_http2_option(self, mock_load_dotenv):
+        """Test HTTP/2 follows h2 availability unless set explicitly."""
+        with patch("glaip_sdk.client.base.H2_AVAILABLE", False):
+            client = BaseClient(api_url="http://test.com", api_key="test-key")
+        assert client._http2 is False
+        assert BaseClient(parent_client=client)._http2 is False
+
+        with patch("glaip_sdk.client.base.httpx.Client") as mock_httpx_client:
+            BaseClient(api_url="http://test.com", api_key="test-key", http2=True)
+        assert mock_httpx_client.call_args[1]["http2"] is True
@@ -5,11 +5,13 @@ Tests the main Client class functionality without external dependencies.
 """
 
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from glaip_sdk.client import Client
+from glaip_sdk.exceptions import NotFoundError
+from glaip_sdk.models import Agent, Tool
 
 
 @pytest.mark.unit
@@ -40,6 +42,20 @@ class TestClient:
         # Client should be closed after context
         assert client.http_client.is_closed is True
 
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_client_close_stops_background_runs(self, mock_load_dotenv):
+        """Test closing the client waits for background runs before closing."""
+        client = Client(api_url="http://test.com", api_key="test-key")
+
+        with patch.object(client.agents, "run_agent", return_value="done"):
+            client.agents.start_agent_run("agent-id", "hello")
+            executor = client.agents._background_executor
+            client.close()
+
+        assert executor._shutdown is True
+        assert client.http_client.is_closed is True
+
     @patch.dict(os.environ, {}, clear=True)
     @patch("glaip_sdk.client.base.load_dotenv")
     def test_client_timeout_property(self, mock_load_dotenv):
@@ -323,6 +339,110 @@ class TestClient:
             assert result == mock_mcp
             mock_create.assert_called_once_with(name="test-mcp")
 
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_client_delete_many(self, mock_load_dotenv):
+        """Test deleting several resources of different kinds."""
+        client = Client(api_url="http://test.com", api_key="test-key")
+
+        with (
+            patch.object(client.agents, "delete_agent") as mock_delete_agent,
+            patch.object(client.tools, "delete_tool") as mock_delete_tool,
+        ):
+            mock_delete_tool.side_effect = RuntimeError("boom")
+            with pytest.raises(RuntimeError, match="boom"):
+                client.delete_many([("tool", "tool-1"), ("agent", "agent-1")])
+
+            # The agent is still deleted even though the tool deletion failed
+            mock_delete_agent.assert_called_once_with("agent-1")
+            mock_delete_tool.assert_called_once_with("tool-1")
+
+        with pytest.raises(ValueError, match="Unknown resource kind"):
+            client.delete_many([("widget", "w-1")])
+
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_client_delete_many_missing_ok(self, mock_load_dotenv):
+        """Test duplicate refs are deleted once and missing resources are skipped."""
+        client = Client(api_url="http://test.com", api_key="test-key")
+
+        with patch.object(client.tools, "delete_tool") as mock_delete_tool:
+            mock_delete_tool.side_effect = NotFoundError("gone", status_code=404)
+            client.delete_many(
+                [("tool", "tool-1"), ("tool", "tool-1")], missing_ok=True
+            )
+            mock_delete_tool.assert_called_once_with("tool-1")
+
+            with pytest.raises(NotFoundError):
+                client.delete_many([("tool", "tool-1")])
+
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_client_warmup(self, mock_load_dotenv):
+        """Test warmup runs a health check in the background without raising."""
+        client = Client(api_url="http://test.com", api_key="test-key")
+
+        with patch.object(client, "ping", return_value=False) as mock_ping:
+            thread = client.warmup()
+            thread.join(timeout=5)
+
+        assert thread.daemon
+        mock_ping.assert_called_once_with()
+
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_client_multi_get(self, mock_load_dotenv):
+        """Test fetching resources of different kinds in one call."""
+        client = Client(api_url="http://test.com", api_key="test-key")
+        agent = Agent(id="agent-1", name="agent")
+        tool = Tool(id="tool-1", name="tool")
+
+        with (
+            patch.object(client, "get_agent_by_id", return_value=agent) as mock_agent,
+            patch.object(client, "get_tool_by_id", return_value=tool) as mock_tool,
+        ):
+            result = client.multi_get(
+                [("tool", "tool-1"), ("agent", "agent-1"), ("tool", "tool-1")]
+            )
+
+        assert result == {("tool", "tool-1"): tool, ("agent", "agent-1"): agent}
+        mock_agent.assert_called_once_with("agent-1")
+        mock_tool.assert_called_once_with("tool-1")
+
+        with pytest.raises(ValueError, match="Unknown resource kind"):
+            client.multi_get([("widget", "w-1")])
+
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_client_delete_agents_and_tools(self, mock_load_dotenv):
+        """Test bulk agent and tool deletion helpers."""
+        client = Client(api_url="http://test.com", api_key="test-key")
+
+        with (
+            patch.object(client.agents, "delete_agent") as mock_delete_agent,
+            patch.object(client.tools, "delete_tool") as mock_delete_tool,
+        ):
+            client.delete_agents(["agent-1", "agent-2"])
+            client.delete_tools(["tool-1"])
+
+        assert sorted(c.args[0] for c in mock_delete_agent.call_args_list) == [
+            "agent-1",
+            "agent-2",
+        ]
+        mock_delete_tool.assert_called_once_with("tool-1")
+
+    @patch("glaip_sdk.client.base.load_dotenv")
+    def test_client_teardown(self, mock_load_dotenv):
+        """Test tearing down resource objects deletes them by kind."""
+        client = Client(api_url="http://test.com", api_key="test-key")
+        agent = Agent(id="agent-1", name="agent")
+        tool = Tool(id="tool-1", name="tool")
+
+        with patch.object(client, "delete_many") as mock_delete_many:
+            client.teardown(tool, agent)
+            assert mock_delete_many.call_args_list == [
+                call([("agent", "agent-1")]),
+                call([("tool", "tool-1")]),
+            ]
+
+        with pytest.raises(TypeError):
+            client.teardown("agent-1")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-m", "unit"])
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Unit tests for the AIP SDK response cache."""
+
+import pytest
+
+from glaip_sdk.cache import ResponseCache
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test ResponseCache storage and eviction."""
+
+    def test_get_missing_key(self, tmp_path):
+        """Test a missing key is a cache miss."""
+        cache = ResponseCache(tmp_path)
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self, tmp_path):
+        """Test stored responses round-trip through disk."""
+        cache = ResponseCache(tmp_path)
+        cache.set("key", "Hello!")
+        assert cache.get("key") == "Hello!"
+        assert ResponseCache(tmp_path).get("key") == "Hello!"
+
+    def test_make_key_ignores_tool_order(self):
+        """Test keys depend on the tool set, not its order."""
+        first = ResponseCache.make_key("id", "instr", ["a", "b"], [], {}, "hi")
+        second = ResponseCache.make_key("id", "instr", ["b", "a"], [], {}, "hi")
+        assert first == second
+        assert first != ResponseCache.make_key("id", "instr", ["a", "b"], [], {}, "bye")
+        assert first != ResponseCache.make_key(
+            "id", "instr", ["a", "b"], [], {}, "hi", chat_history=[{"role": "user"}]
+        )
+
+    def test_make_key_covers_agent_identity(self):
+        """Test keys differ by agent ID, sub-agents and model settings."""
+        base = ResponseCache.make_key("id", "instr", [], ["sub"], {"m": 1}, "hi")
+        assert base != ResponseCache.make_key(
+            "other", "instr", [], ["sub"], {"m": 1}, "hi"
+        )
+        assert base != ResponseCache.make_key(
+            "id", "instr", [], ["sub2"], {"m": 1}, "hi"
+        )
+        assert base != ResponseCache.make_key(
+            "id", "instr", [], ["sub"], {"m": 2}, "hi"
+        )
+
+    def test_evicts_oldest_entries(self, tmp_path):
+        """Test the cache keeps at most max_entries entries."""
+        cache = ResponseCache(tmp_path, max_entries=2)
+        for index in range(3):
+            cache.set(f"key{index}", str(index))
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_clear(self, tmp_path):
+        """Test clearing removes all entries."""
+        cache = ResponseCache(tmp_path)
+        cache.set("key", "value")
+        cache.clear()
+        assert cache.get("key") is None
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Unit tests for the examples' shared runtime helpers."""
+
+import signal
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from examples._shared import runtime
+from examples._shared.runtime import Step, parallel_create, register_delete, run_dag
+
+# Importing the runtime installs the examples' exit signal handlers; restore
+# the defaults so interrupting the test run behaves as usual
+signal.signal(signal.SIGINT, signal.default_int_handler)
+signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_EXIT_SCRIPT = textwrap.dedent(
+    """
+    from examples._shared.runtime import register_delete
+    from glaip_sdk.exceptions import NotFoundError
+
+
+    class FakeClient:
+        def delete_agent(self, resource_id):
+            print(f"delete agent {resource_id}")
+
+        def delete_tool(self, resource_id):
+            print(f"delete tool {resource_id}")
+
+        def delete_mcp(self, resource_id):
+            raise NotFoundError(f"MCP not found: {resource_id}")
+
+
+    client = FakeClient()
+    register_delete(client, "tool", "t1")
+    register_delete(client, "agent", "a1")
+    register_delete(client, "mcp", "m1")
+    register_delete(client, "agent", "a1")
+    """
+)
+
+_CLEANUP_SCRIPT = textwrap.dedent(
+    """
+    from examples._shared.runtime import register_cleanup
+
+
+    def fail():
+        raise RuntimeError("boom")
+
+
+    register_cleanup(lambda: print("cleanup one"))
+    register_cleanup(fail)
+    register_cleanup(lambda: print("cleanup three"))
+    """
+)
+
+
+def _run_script(script: str) -> subprocess.CompletedProcess:
+    """Run a script that uses the runtime helpers and let it exit normally."""
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+@pytest.mark.unit
+class TestRunCleanup:
+    """Test the cleanup run by the examples' exit hook."""
+
+    def test_queued_deletes_flushed_on_exit(self):
+        """Test queued deletions are issued at exit, agents first, once each."""
+        result = _run_script(_EXIT_SCRIPT)
+
+        assert result.returncode == 0, result.stderr
+        assert "Traceback" not in result.stderr
+        deletes = [
+            line for line in result.stdout.splitlines() if line.startswith("delete")
+        ]
+        assert deletes == ["delete agent a1", "delete tool t1"]
+        assert "Deleted 3 queued resources" in result.stdout
+
+    def test_cleanup_functions_run_on_exit(self):
+        """Test every registered cleanup runs at exit, even after a failure."""
+        result = _run_script(_CLEANUP_SCRIPT)
+
+        assert result.returncode == 0, result.stderr
+        assert "Traceback" not in result.stderr
+        assert "cleanup one" in result.stdout
+        assert "cleanup three" in result.stdout
+        assert "Cleanup 2/3 failed: boom" in result.stdout
+
+
+@pytest.mark.unit
+class TestParallelCreate:
+    """Test concurrent resource creation."""
+
+    def test_results_follow_spec_order(self):
+        """Test created resources come back in spec order."""
+        client = Mock()
+        client.create_agent.side_effect = lambda name: f"agent:{name}"
+        client.create_tool.side_effect = lambda name: f"tool:{name}"
+
+        results = parallel_create(
+            client,
+            [
+                {"kind": "agent", "name": "a"},
+                {"kind": "tool", "name": "t"},
+                {"kind": "agent", "name": "b"},
+            ],
+        )
+
+        assert results == ["agent:a", "tool:t", "agent:b"]
+
+    def test_failed_create_still_reports_siblings(self):
+        """Test siblings of a failed create reach on_created before the error."""
+        client = Mock()
+        client.create_tool.side_effect = RuntimeError("upload failed")
+        client.create_agent.side_effect = lambda name: f"agent:{name}"
+        created = []
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            parallel_create(
+                client,
+                [{"kind": "tool", "name": "t"}, {"kind": "agent", "name": "a"}],
+                on_created=lambda kind, resource: created.append((kind, resource)),
+            )
+
+        assert created == [("agent", "agent:a")]
+
+    def test_empty_specs(self):
+        """Test no specs makes no calls."""
+        client = Mock()
+        assert parallel_create(client, []) == []
+        assert client.mock_calls == []
+
+
+@pytest.mark.unit
+class TestRegisterDelete:
+    """Test queueing resource deletions."""
+
+    def test_queues_each_resource_once_per_client(self, monkeypatch):
+        """Test repeated registrations queue a resource once, per client."""
+        monkeypatch.setattr(runtime, "_pending_deletes", {})
+        first, second = object(), object()
+
+        register_delete(first, "agent", "a1")
+        register_delete(first, "agent", "a1")
+        register_delete(first, "tool", "t1")
+        register_delete(second, "agent", "a2")
+
+        client, buckets = runtime._pending_deletes[id(first)]
+        assert client is first
+        assert {kind: list(ids) for kind, ids in buckets.items()} == {
+            "agent": ["a1"],
+            "tool": ["t1"],
+        }
+        assert list(runtime._pending_deletes[id(second)][1]["agent"]) == ["a2"]
+
+
+@pytest.mark.unit
+class TestRunDag:
+    """Test the dependency-graph step runner."""
+
+    def test_steps_run_after_their_dependencies(self):
+        """Test every step starts only after the steps it depends on."""
+        order = []
+        steps = [
+            Step("report", lambda: order.append("report"), deps=("a", "b")),
+            Step("a", lambda: order.append("a")),
+            Step("b", lambda: order.append("b"), deps=("a",)),
+        ]
+
+        results = run_dag(steps)
+
+        assert order == ["a", "b", "report"]
+        assert set(results) == {"a", "b", "report"}
+
+    def test_single_worker_keeps_given_order(self):
+        """Test max_workers=1 runs free steps in the order given."""
+        order = []
+        steps = [Step(name, lambda name=name: order.append(name)) for name in "cab"]
+
+        run_dag(steps, max_workers=1)
+
+        assert order == ["c", "a", "b"]
+
+    def test_returns_results_by_name(self):
+        """Test each step's return value is keyed by its name."""
+        assert run_dag([Step("one", lambda: 1), Step("two", lambda: 2)]) == {
+            "one": 1,
+            "two": 2,
+        }
+
+    def test_rejects_unknown_dependency(self):
+        """Test a dependency on a missing step is rejected before running."""
+        ran = []
+        with pytest.raises(ValueError, match="unknown steps"):
+            run_dag([Step("a", lambda: ran.append("a"), deps=("missing",))])
+        assert ran == []
+
+    def test_rejects_cycle(self):
+        """Test a dependency cycle is rejected before any step runs."""
+        ran = []
+        steps = [
+            Step("free", lambda: ran.append("free")),
+            Step("a", lambda: ran.append("a"), deps=("b",)),
+            Step("b", lambda: ran.append("b"), deps=("a",)),
+        ]
+        with pytest.raises(ValueError, match="cycle"):
+            run_dag(steps)
+        assert ran == []
+
+    def test_error_propagates_and_stops_dependents(self):
+        """Test a failed step's error is raised and its dependents never run."""
+        ran = []
+
+        def fail():
+            raise RuntimeError("step failed")
+
+        steps = [
+            Step("broken", fail),
+            Step("after", lambda: ran.append("after"), deps=("broken",)),
+        ]
+        with pytest.raises(RuntimeError, match="step failed"):
+            run_dag(steps)
+        assert ran == []
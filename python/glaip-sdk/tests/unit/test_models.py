@@ -5,10 +5,13 @@ Authors:
     Raymond Christopher (raymond.christopher@gdplabs.id)
 """
 
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
 
+from glaip_sdk.cache import ResponseCache
+from glaip_sdk.config.constants import NO_RESPONSE_CONTENT
 from glaip_sdk.models import MCP, Agent, LanguageModelResponse, Tool, TTYRenderer
 
 
@@ -118,6 +121,97 @@ class TestAgent:
             max_tokens=100,
         )
 
+    def test_agent_run_uses_response_cache(self, tmp_path):
+        """Test running agent serves repeated prompts from the response cache."""
+        agent = Agent(id="test-id", name="Test Agent", instruction="Be nice")
+        mock_client = Mock()
+        mock_client.response_cache = ResponseCache(tmp_path)
+        mock_client.run_agent.return_value = "test response"
+        agent._set_client(mock_client)
+
+        assert agent.run("test message", renderer="silent") == "test response"
+        assert agent.run("test message") == "test response"
+        mock_client.run_agent.assert_called_once()
+
+        agent.run("other message")
+        assert mock_client.run_agent.call_count == 2
+
+    def test_agent_run_cache_misses_for_different_model(self, tmp_path):
+        """Test agents that differ only in model do not share cached answers."""
+        mock_client = Mock()
+        mock_client.response_cache = ResponseCache(tmp_path)
+        mock_client.run_agent.side_effect = ["answer one", "answer two"]
+        first = Agent(
+            id="test-id",
+            name="Test Agent",
+            instruction="Be nice",
+            language_model_id="model-a",
+        )
+        second = first.model_copy(update={"language_model_id": "model-b"})
+        first._set_client(mock_client)
+        second._set_client(mock_client)
+
+        assert first.run("test message") == "answer one"
+        assert second.run("test message") == "answer two"
+        assert mock_client.run_agent.call_count == 2
+
+    def test_agent_run_does_not_cache_empty_response(self, tmp_path):
+        """Test running agent does not cache the empty-stream placeholder."""
+        agent = Agent(id="test-id", name="Test Agent", instruction="Be nice")
+        mock_client = Mock()
+        mock_client.response_cache = ResponseCache(tmp_path)
+        mock_client.run_agent.return_value = NO_RESPONSE_CONTENT
+        agent._set_client(mock_client)
+
+        assert agent.run("test message") == NO_RESPONSE_CONTENT
+        assert agent.run("test message") == NO_RESPONSE_CONTENT
+        assert mock_client.run_agent.call_count == 2
+
+    def test_agent_run_batch_without_client(self):
+        """Test running a batch without a client raises an error."""
+        agent = Agent(id="test-id", name="Test Agent")
+
+        with pytest.raises(RuntimeError, match="No client available"):
+            agent.run_batch(["one", "two"])
+
+    def test_agent_run_batch_with_client(self):
+        """Test running a batch delegates to the client."""
+        agent = Agent(id="test-id", name="Test Agent")
+        mock_client = Mock()
+        mock_client.run_batch.return_value = iter(["first", "second"])
+        agent._set_client(mock_client)
+
+        result = asyncio.run(agent.run_batch_async(["one", "two"], session_id="s"))
+
+        assert result == ["first", "second"]
+        mock_client.run_batch.assert_called_once_with(
+            "test-id", ["one", "two"], session_id="s", agent_name="Test Agent"
+        )
+
+    def test_agent_run_in_background(self):
+        """Test background runs return a task ID that collect() resolves."""
+        mock_client = Mock()
+        mock_client.start_agent_run.return_value = "task-1"
+        mock_client.collect_agent_run.return_value = "answer"
+        agent = Agent(id="123", name="test")._set_client(mock_client)
+
+        assert agent.run("hi", background=True) == "task-1"
+        assert agent.collect("task-1") == "answer"
+        mock_client.start_agent_run.assert_called_once_with(
+            "123", "hi", agent_name="test"
+        )
+        mock_client.collect_agent_run.assert_called_once_with("task-1", timeout=None)
+        mock_client.run_agent.assert_not_called()
+
+    def test_agent_run_stream(self):
+        """Test run_stream yields the client's streamed content."""
+        mock_client = Mock()
+        mock_client.stream_agent.return_value = iter(["a", "b"])
+        agent = Agent(id="123", name="test")._set_client(mock_client)
+
+        assert list(agent.run_stream("hi", session_id="s")) == ["a", "b"]
+        mock_client.stream_agent.assert_called_once_with("123", "hi", session_id="s")
+
     def test_agent_update_without_client(self):
         """Test updating agent without client raises error."""
         agent = Agent(id="test-id", name="Test Agent")
@@ -5,6 +5,8 @@ Tests the utility functions without external dependencies.
 """
 
 import uuid
+from collections import deque
+from collections.abc import Iterator
 from unittest.mock import patch
 
 import pytest
@@ -150,95 +152,95 @@ class TestNameSanitization:
 class TestFileSizeFormatting:
     """Test file size formatting utility function."""
 
-    def test_bytes_formatting(self):
-        """Test formatting of small file sizes in bytes."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "size_bytes, expected_output",
+        [
             (0, "0.0 B"),  # Function returns "0.0 B"
             (1, "1.0 B"),  # Function returns "1.0 B"
             (1023, "1023.0 B"),  # Function returns "1023.0 B"
             (512, "512.0 B"),  # Function returns "512.0 B"
             (999, "999.0 B"),  # Function returns "999.0 B"
-        ]
-
-        for size_bytes, expected_output in test_cases:
-            result = format_file_size(size_bytes)
-            assert result == expected_output
+        ],
+    )
+    def test_bytes_formatting(self, size_bytes, expected_output):
+        """Test formatting of small file sizes in bytes."""
+        assert format_file_size(size_bytes) == expected_output
 
-    def test_kilobytes_formatting(self):
-        """Test formatting of file sizes in kilobytes."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "size_bytes, expected_output",
+        [
             (1024, "1.0 KB"),
             (1536, "1.5 KB"),
             (2048, "2.0 KB"),
             (1048575, "1024.0 KB"),  # Just under 1 MB
-        ]
-
-        for size_bytes, expected_output in test_cases:
-            result = format_file_size(size_bytes)
-            assert result == expected_output
+        ],
+    )
+    def test_kilobytes_formatting(self, size_bytes, expected_output):
+        """Test formatting of file sizes in kilobytes."""
+        assert format_file_size(size_bytes) == expected_output
 
-    def test_megabytes_formatting(self):
-        """Test formatting of file sizes in megabytes."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "size_bytes, expected_output",
+        [
             (1048576, "1.0 MB"),
             (1572864, "1.5 MB"),
             (2097152, "2.0 MB"),
             (1073741823, "1024.0 MB"),  # Just under 1 GB
-        ]
-
-        for size_bytes, expected_output in test_cases:
-            result = format_file_size(size_bytes)
-            assert result == expected_output
+        ],
+    )
+    def test_megabytes_formatting(self, size_bytes, expected_output):
+        """Test formatting of file sizes in megabytes."""
+        assert format_file_size(size_bytes) == expected_output
 
-    def test_gigabytes_formatting(self):
-        """Test formatting of file sizes in gigabytes."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "size_bytes, expected_output",
+        [
             (1073741824, "1.0 GB"),
             (1610612736, "1.5 GB"),
             (2147483648, "2.0 GB"),
             (1099511627775, "1024.0 GB"),  # Just under 1 TB
-        ]
-
-        for size_bytes, expected_output in test_cases:
-            result = format_file_size(size_bytes)
-            assert result == expected_output
+        ],
+    )
+    def test_gigabytes_formatting(self, size_bytes, expected_output):
+        """Test formatting of file sizes in gigabytes."""
+        assert format_file_size(size_bytes) == expected_output
 
-    def test_terabytes_formatting(self):
-        """Test formatting of file sizes in terabytes."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "size_bytes, expected_output",
+        [
             (1099511627776, "1.0 TB"),
             (1649267441664, "1.5 TB"),
             (2199023255552, "2.0 TB"),
-        ]
-
-        for size_bytes, expected_output in test_cases:
-            result = format_file_size(size_bytes)
-            assert result == expected_output
+        ],
+    )
+    def test_terabytes_formatting(self, size_bytes, expected_output):
+        """Test formatting of file sizes in terabytes."""
+        assert format_file_size(size_bytes) == expected_output
 
-    def test_precision_handling(self):
-        """Test precision handling in file size formatting."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "size_bytes, expected_output",
+        [
             (1025, "1.0 KB"),  # Should round down
             (1537, "1.5 KB"),  # Should round up
             (1049600, "1.0 MB"),  # Just over 1 MB
             (1572864, "1.5 MB"),  # Exactly 1.5 MB
-        ]
-
-        for size_bytes, expected_output in test_cases:
-            result = format_file_size(size_bytes)
-            assert result == expected_output
+        ],
+    )
+    def test_precision_handling(self, size_bytes, expected_output):
+        """Test precision handling in file size formatting."""
+        assert format_file_size(size_bytes) == expected_output
 
-    def test_edge_cases(self):
-        """Test edge cases for file size formatting."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "size_input, expected_output",
+        [
             (-1, "-1.0 B"),  # Function returns "-1.0 B" for negative
             (-1024, "-1024.0 B"),  # Function returns "-1024.0 B" for negative
             # Note: Function doesn't handle None or invalid input gracefully
-        ]
-
-        for size_input, expected_output in test_cases:
-            result = format_file_size(size_input)
-            assert result == expected_output
+        ],
+    )
+    def test_edge_cases(self, size_input, expected_output):
+        """Test edge cases for file size formatting."""
+        assert format_file_size(size_input) == expected_output
 
 
 @pytest.mark.unit
@@ -249,7 +251,7 @@ class TestProgressBar:
     def test_progress_bar_basic(self, mock_print):
         """Test basic progress bar functionality."""
         # progress_bar takes an iterable and description
-        list(progress_bar([1, 2, 3], "Test task"))
+        deque(progress_bar([1, 2, 3], "Test task"), maxlen=0)
         # Should not call print directly (uses click.progressbar)
 
         # Progress bar uses click.progressbar, not print directly
@@ -260,7 +262,7 @@ class TestProgressBar:
     def test_progress_bar_completion(self, mock_print):
         """Test progress bar at 100% completion."""
         # progress_bar takes an iterable and description
-        list(progress_bar([1, 2, 3], "Test task"))
+        deque(progress_bar([1, 2, 3], "Test task"), maxlen=0)
         # Should not call print directly (uses click.progressbar)
 
         # Progress bar uses click.progressbar, not print directly
@@ -271,7 +273,7 @@ class TestProgressBar:
     def test_progress_bar_halfway(self, mock_print):
         """Test progress bar at 50% completion."""
         # progress_bar takes an iterable and description
-        list(progress_bar([1, 2], "Test task"))
+        deque(progress_bar([1, 2], "Test task"), maxlen=0)
         # Should not call print directly (uses click.progressbar)
 
         # Progress bar uses click.progressbar, not print directly
@@ -282,24 +284,24 @@ class TestProgressBar:
     def test_progress_bar_edge_cases(self, mock_print):
         """Test progress bar edge cases."""
         # Test with empty iterable
-        list(progress_bar([], "Test task"))
+        deque(progress_bar([], "Test task"), maxlen=0)
         # Should not call print directly (uses click.progressbar)
 
         # Test with current = 0
         # progress_bar takes iterable, not current/total
-        list(progress_bar([], "Test task"))
+        deque(progress_bar([], "Test task"), maxlen=0)
         # Should not call print directly (uses click.progressbar)
 
         # Test with total = 0 (should handle gracefully)
         # progress_bar takes iterable, not current/total
-        list(progress_bar([], "Test task"))
+        deque(progress_bar([], "Test task"), maxlen=0)
         # Should not call print directly (uses click.progressbar)
 
     @patch("builtins.print")
     def test_progress_bar_formatting(self, mock_print):
         """Test progress bar formatting."""
         # progress_bar takes an iterable and description
-        list(progress_bar([1], "Custom Task Name"))
+        deque(progress_bar([1], "Custom Task Name"), maxlen=0)
         # Should not call print directly (uses click.progressbar)
 
         # Progress bar uses click.progressbar, not print directly
@@ -311,9 +313,9 @@ class TestProgressBar:
         # Should not raise any exceptions
         try:
             # progress_bar takes an iterable and description
-            list(progress_bar([1, 2, 3], "Test task"))
-            list(progress_bar([1, 2], "Test task"))
-            list(progress_bar([1], "Test task"))
+            deque(progress_bar([1, 2, 3], "Test task"), maxlen=0)
+            deque(progress_bar([1, 2], "Test task"), maxlen=0)
+            deque(progress_bar([1], "Test task"), maxlen=0)
         except Exception as e:
             pytest.fail(f"Progress bar raised an exception: {e}")
 
@@ -358,20 +360,18 @@ class TestUtilityIntegration:
         assert "MB" in total_formatted
         assert "KB" in processed_formatted  # 0.5 MB = 512.0 KB
 
-    def test_utility_function_types(self):
+    @pytest.mark.parametrize(
+        "func, arg, expected_type",
+        [
+            (is_uuid, str(uuid.uuid4()), bool),
+            (sanitize_name, "test name", str),
+            (format_file_size, 1024, str),
+            (progress_bar, [1, 2, 3], Iterator),
+        ],
+    )
+    def test_utility_function_types(self, func, arg, expected_type):
         """Test that utility functions return expected types."""
-        # UUID validation should return boolean
-        assert isinstance(is_uuid(str(uuid.uuid4())), bool)
-
-        # Name sanitization should return string
-        assert isinstance(sanitize_name("test name"), str)
-
-        # File size formatting should return string
-        assert isinstance(format_file_size(1024), str)
-
-        # Progress bar should return an iterable
-        result = progress_bar([1, 2, 3], "test")
-        assert hasattr(result, "__iter__")
+        assert isinstance(func(arg), expected_type)
 
 
 if __name__ == "__main__":